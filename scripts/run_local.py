@@ -19,23 +19,18 @@ Arguments:
 """
 
 import argparse
-import json
 import logging
 import sys
 from pathlib import Path
 
+import orjson
+
 # Ensure project root is on sys.path so `from src.…` works
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from src.config import LOOKBACK_DAYS, SOURCES
-from src.ingest import ingest_all
-from src.summarize import summarize
-from src.scriptgen import generate_script
-from src.tts import synthesize_script
-from src.audio import stitch_audio
-from src.publish import create_episode_item, get_episode_metadata, update_feed
-from src.pipeline import run_pipeline
-from src.config import EPISODES_DIR, PAGES_BASE_URL, SITE_DIR
+# Stage modules are imported inside their handlers, so a single-stage run
+# (e.g. --stage publish) doesn't load the TTS/Anthropic SDKs it never uses.
+from src.config import EPISODES_DIR, LOOKBACK_DAYS, PAGES_BASE_URL, SITE_DIR, SOURCES
 
 logging.basicConfig(
     level=logging.INFO,
@@ -45,23 +40,31 @@ logger = logging.getLogger(__name__)
 
 
 def _load_input(path: str) -> dict | list:
-    with open(path) as f:
-        return json.load(f)
+    return orjson.loads(Path(path).read_bytes())
+
+
+def _encode(obj):
+    """orjson fallback for the non-JSON types stage outputs carry (datetimes are native)."""
+    if isinstance(obj, Path):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
 
 
 def _write_output(data, output_path: str | None) -> None:
-    text = json.dumps(data, indent=2, ensure_ascii=False, default=str)
+    raw = orjson.dumps(data, default=_encode, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
     if output_path:
-        Path(output_path).write_text(text)
+        Path(output_path).write_bytes(raw)
         logger.info("Output written to %s", output_path)
     else:
-        print(text)
+        sys.stdout.buffer.write(raw + b"\n")
 
 
 def run_ingest(args):
+    from src.ingest import ingest_all
+
     sources = SOURCES
     if args.source:
-        sources = [s for s in SOURCES if s["name"] == args.source]
+        sources = tuple(s for s in SOURCES if s.name == args.source)
         if not sources:
             logger.error("Source '%s' not found in config.SOURCES", args.source)
             sys.exit(1)
@@ -71,6 +74,8 @@ def run_ingest(args):
 
 
 def run_summarize(args):
+    from src.summarize import summarize
+
     if not args.input:
         logger.error("--input required for summarize stage")
         sys.exit(1)
@@ -80,6 +85,8 @@ def run_summarize(args):
 
 
 def run_script(args):
+    from src.scriptgen import generate_script
+
     if not args.input:
         logger.error("--input required for script stage")
         sys.exit(1)
@@ -89,6 +96,8 @@ def run_script(args):
 
 
 def run_tts(args):
+    from src.tts import synthesize_script
+
     if not args.input:
         logger.error("--input required for tts stage")
         sys.exit(1)
@@ -98,6 +107,8 @@ def run_tts(args):
 
 
 def run_audio(args):
+    from src.audio import stitch_audio
+
     if not args.input:
         logger.error("--input required for audio stage")
         sys.exit(1)
@@ -111,6 +122,8 @@ def run_audio(args):
 
 
 def run_publish(args):
+    from src.publish import create_episode_item, get_episode_metadata, update_feed
+
     if not args.input:
         logger.error("--input required for publish stage (path to mp3)")
         sys.exit(1)
@@ -124,6 +137,8 @@ def run_publish(args):
 
 
 def run_all(args):
+    from src.pipeline import run_pipeline
+
     result = run_pipeline(dry_run=args.dry_run)
     _write_output(result, args.output)
 
@@ -1,35 +1,78 @@
 import logging
+import shutil
 import subprocess
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 
-from src.config import MP3_BITRATE, PAUSE_BETWEEN_SPEAKERS_MS
+from mutagen import MutagenError
+from mutagen.mp3 import MP3
+
+from src.config import (
+    MP3_BITRATE,
+    PAUSE_BETWEEN_SPEAKERS_MS,
+    SILENCE_CACHE_DIR,
+    TTS_SAMPLE_RATE_HZ,
+)
 
 logger = logging.getLogger(__name__)
 
+# duration_ms -> encoded silence, so only the first stitch in a process forks ffmpeg
+_silence_cache: dict[int, bytes] = {}
+
 
 def generate_silence(duration_ms: int, output_path: Path) -> Path:
     """Generate a silent MP3 of the given duration using ffmpeg.
 
+    Encoded with the same sample rate, channel layout and bitrate as Google
+    TTS MP3 output so stitch_audio can stream-copy it alongside the segments.
+    The encoded bytes are memoized per duration in-process and kept under
+    SILENCE_CACHE_DIR, so later runs don't fork ffmpeg for it at all.
+
     Returns output_path.
     """
+    cached = _silence_cache.get(duration_ms)
+    if cached is None:
+        cached = _load_cached_silence(duration_ms)
+    if cached is not None:
+        _silence_cache[duration_ms] = cached
+        output_path.write_bytes(cached)
+        return output_path
+
     duration_s = duration_ms / 1000
     subprocess.run(
         [
             "ffmpeg", "-y",
             "-f", "lavfi",
-            "-i", f"anullsrc=r=24000:cl=mono",
+            "-i", f"anullsrc=r={TTS_SAMPLE_RATE_HZ}:cl=mono",
             "-t", str(duration_s),
+            "-ar", str(TTS_SAMPLE_RATE_HZ),
+            "-ac", "1",
             "-c:a", "libmp3lame",
-            "-b:a", "128k",
+            "-b:a", f"{MP3_BITRATE // 1000}k",
             str(output_path),
         ],
         capture_output=True,
         check=True,
     )
+    if output_path.exists():
+        _silence_cache[duration_ms] = output_path.read_bytes()
+        _store_silence(duration_ms, _silence_cache[duration_ms])
     return output_path
 
 
+def warm_silence_cache(duration_ms: int = PAUSE_BETWEEN_SPEAKERS_MS) -> None:
+    """Encode the speaker-turn silence ahead of stitch_audio.
+
+    Meant to run alongside TTS so the only ffmpeg call left for the stitch
+    stage is the concat itself.
+    """
+    if duration_ms in _silence_cache:
+        return
+    with tempfile.TemporaryDirectory(prefix="silence_") as tmp:
+        generate_silence(duration_ms, Path(tmp) / "silence.mp3")
+
+
 def stitch_audio(
     segment_paths: list[Path],
     output_path: Path,
@@ -37,33 +80,54 @@ def stitch_audio(
 ) -> Path:
     """Concatenate segment MP3s with silence gaps between speaker turns.
 
+    Segments and silence share codec parameters, so the concat demuxer
+    stream-copies MP3 frames (-c:a copy) instead of re-encoding.
+
+    A single segment is copied as is, and pause_ms <= 0 skips the silence.
+
     Returns output_path.
     Raises subprocess.CalledProcessError on ffmpeg failure (hard fail).
     """
+    if len(segment_paths) == 1:
+        shutil.copyfile(segment_paths[0], output_path)
+        return output_path
+
     tmp_dir = Path(tempfile.mkdtemp(prefix="stitch_"))
 
     # Generate silence file
-    silence_path = tmp_dir / "silence.mp3"
-    generate_silence(pause_ms, silence_path)
+    silence_path = None
+    if pause_ms > 0:
+        silence_path = tmp_dir / "silence.mp3"
+        generate_silence(pause_ms, silence_path)
 
-    # Build concat list
-    concat_list_path = tmp_dir / "concat_list.txt"
-    lines = []
+    inputs = []
     for i, seg_path in enumerate(segment_paths):
-        lines.append(f"file '{seg_path}'")
-        if i < len(segment_paths) - 1:
-            lines.append(f"file '{silence_path}'")
-    concat_list_path.write_text("\n".join(lines))
+        inputs.append(seg_path)
+        if silence_path is not None and i < len(segment_paths) - 1:
+            inputs.append(silence_path)
+
+    return concat_mp3(inputs, output_path, tmp_dir)
+
+
+def concat_mp3(input_paths: list[Path], output_path: Path, work_dir: Path) -> Path:
+    """Join MP3 files with the ffmpeg concat demuxer, frame by frame.
+
+    Inputs must share codec parameters; MP3 frames are stream-copied
+    (-c:a copy), never re-encoded. The concat list is written to work_dir.
+
+    Returns output_path.
+    Raises subprocess.CalledProcessError on ffmpeg failure.
+    """
+    concat_list_path = work_dir / "concat_list.txt"
+    concat_list_path.write_text("\n".join(_concat_entry(path) for path in input_paths))
 
-    # Run ffmpeg concat demuxer
     subprocess.run(
         [
             "ffmpeg", "-y",
             "-f", "concat",
             "-safe", "0",
             "-i", str(concat_list_path),
-            "-c:a", "libmp3lame",
-            "-b:a", "128k",
+            "-c:a", "copy",
             str(output_path),
         ],
         capture_output=True,
@@ -74,12 +138,13 @@ def stitch_audio(
 
 
 def get_mp3_duration_seconds(file_path: Path) -> float:
-    """Calculate MP3 duration from file size and bitrate.
+    """Read MP3 duration from the stream headers (Xing/Info or frame scan).
 
-    Formula: (file_size_bytes * 8) / MP3_BITRATE
+    Falls back to (file_size_bytes * 8) / MP3_BITRATE if the file can't be
+    parsed. Cached on (path, mtime) so repeated feed builds don't re-parse.
     """
-    size_bytes = file_path.stat().st_size
-    return (size_bytes * 8) / MP3_BITRATE
+    stat = file_path.stat()
+    return _mp3_duration(str(file_path), stat.st_mtime_ns, stat.st_size)
 
 
 def format_duration_itunes(seconds: float) -> str:
@@ -92,3 +157,45 @@ def format_duration_itunes(seconds: float) -> str:
     minutes = (total % 3600) // 60
     secs = total % 60
     return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
+
+# ── Helpers ────────────────────────────────────────────
+
+
+def _silence_cache_path(duration_ms: int) -> Path:
+    """Named by every parameter that shapes the encoded silence."""
+    return SILENCE_CACHE_DIR / f"{duration_ms}ms_{TTS_SAMPLE_RATE_HZ}hz_{MP3_BITRATE}bps.mp3"
+
+
+def _load_cached_silence(duration_ms: int) -> bytes | None:
+    try:
+        return _silence_cache_path(duration_ms).read_bytes() or None
+    except OSError:
+        return None
+
+
+def _store_silence(duration_ms: int, encoded: bytes) -> None:
+    """Write via a temp file + rename, so a reader never sees a partial file."""
+    path = _silence_cache_path(duration_ms)
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(encoded)
+        tmp_path.replace(path)
+    except OSError as e:
+        logger.warning("Failed to cache silence in %s: %s", path, e)
+
+
+def _concat_entry(path: Path) -> str:
+    """Concat-demuxer `file` line; a ' inside the quotes is written as '\\''."""
+    escaped = str(path).replace("'", "'\\''")
+    return f"file '{escaped}'"
+
+
+@lru_cache(maxsize=64)
+def _mp3_duration(path: str, mtime_ns: int, size_bytes: int) -> float:
+    try:
+        return MP3(path).info.length
+    except MutagenError as e:
+        logger.warning("Could not parse MP3 header for %s, estimating from size: %s", path, e)
+        return (size_bytes * 8) / MP3_BITRATE
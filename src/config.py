@@ -1,5 +1,7 @@
 import os
+from dataclasses import dataclass
 from pathlib import Path
+
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -9,152 +11,172 @@ ROOT_DIR = Path(__file__).resolve().parent.parent
 PROMPTS_DIR = ROOT_DIR / "prompts"
 SITE_DIR = ROOT_DIR / "site"
 EPISODES_DIR = SITE_DIR / "episodes"
+CACHE_DIR = ROOT_DIR / ".cache"  # local-only; never under site/ (the workflows force-add it)
+TTS_CACHE_DIR = CACHE_DIR / "tts"
+HTTP_CACHE_DIR = CACHE_DIR / "http"
+SUMMARIZE_CACHE_DIR = CACHE_DIR / "summarize"
+SILENCE_CACHE_DIR = CACHE_DIR / "silence"
 
 # ── API Keys (from env) ───────────────────────────────
 ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY", "")
 GOOGLE_APPLICATION_CREDENTIALS = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS", "")
 
 # ── Source List ────────────────────────────────────────
-# Each source dict: name, provider, url, method, enabled
 # method: "rss" | "atom" | "scrape" | "sitemap" | "api"
-SOURCES: list[dict] = [
+
+
+@dataclass(frozen=True, slots=True)
+class SourceConfig:
+    """One ingest source. css_selector is only used by method="scrape"."""
+
+    name: str
+    provider: str
+    url: str
+    method: str
+    enabled: bool = True
+    css_selector: str = "body"
+
+
+SOURCES: tuple[SourceConfig, ...] = (
     # --- Anthropic ---
-    {
-        "name": "anthropic_blog",
-        "provider": "anthropic",
-        "url": "https://raw.githubusercontent.com/taobojlen/anthropic-rss-feed/main/anthropic_news_rss.xml",
-        "method": "rss",
-        "enabled": True,
-    },
-    {
-        "name": "anthropic_engineering",
-        "provider": "anthropic",
-        "url": "https://raw.githubusercontent.com/taobojlen/anthropic-rss-feed/main/anthropic_engineering_rss.xml",
-        "method": "rss",
-        "enabled": True,
-    },
-    {
-        "name": "anthropic_release_notes",
-        "provider": "anthropic",
-        "url": "https://platform.claude.com/docs/en/release-notes/overview",
-        "method": "scrape",
-        "css_selector": "article",
-        "enabled": True,
-    },
-    {
-        "name": "claude_code_releases",
-        "provider": "anthropic",
-        "url": "https://github.com/anthropics/claude-code/releases.atom",
-        "method": "atom",
-        "enabled": True,
-    },
-    {
-        "name": "anthropic_python_sdk",
-        "provider": "anthropic",
-        "url": "https://github.com/anthropics/anthropic-sdk-python/releases.atom",
-        "method": "atom",
-        "enabled": True,
-    },
-    {
-        "name": "anthropic_models",
-        "provider": "anthropic",
-        "url": "https://api.anthropic.com/v1/models",
-        "method": "api",
-        "enabled": True,
-    },
-    {
-        "name": "anthropic_sitemap",
-        "provider": "anthropic",
-        "url": "https://platform.claude.com/sitemap.xml",
-        "method": "sitemap",
-        "enabled": True,
-    },
+    SourceConfig(
+        name="anthropic_blog",
+        provider="anthropic",
+        url="https://raw.githubusercontent.com/taobojlen/anthropic-rss-feed/main/anthropic_news_rss.xml",
+        method="rss",
+        enabled=True,
+    ),
+    SourceConfig(
+        name="anthropic_engineering",
+        provider="anthropic",
+        url="https://raw.githubusercontent.com/taobojlen/anthropic-rss-feed/main/anthropic_engineering_rss.xml",
+        method="rss",
+        enabled=True,
+    ),
+    SourceConfig(
+        name="anthropic_release_notes",
+        provider="anthropic",
+        url="https://platform.claude.com/docs/en/release-notes/overview",
+        method="scrape",
+        css_selector="article",
+        enabled=True,
+    ),
+    SourceConfig(
+        name="claude_code_releases",
+        provider="anthropic",
+        url="https://github.com/anthropics/claude-code/releases.atom",
+        method="atom",
+        enabled=True,
+    ),
+    SourceConfig(
+        name="anthropic_python_sdk",
+        provider="anthropic",
+        url="https://github.com/anthropics/anthropic-sdk-python/releases.atom",
+        method="atom",
+        enabled=True,
+    ),
+    SourceConfig(
+        name="anthropic_models",
+        provider="anthropic",
+        url="https://api.anthropic.com/v1/models",
+        method="api",
+        enabled=True,
+    ),
+    SourceConfig(
+        name="anthropic_sitemap",
+        provider="anthropic",
+        url="https://platform.claude.com/sitemap.xml",
+        method="sitemap",
+        enabled=True,
+    ),
     # --- OpenAI ---
-    {
-        "name": "openai_blog",
-        "provider": "openai",
-        "url": "https://openai.com/blog/rss.xml",
-        "method": "rss",
-        "enabled": True,
-    },
-    {
-        "name": "openai_changelog",
-        "provider": "openai",
-        "url": "https://developers.openai.com/changelog/rss.xml",
-        "method": "rss",
-        "enabled": True,
-    },
-    {
-        "name": "openai_community",
-        "provider": "openai",
-        "url": "https://community.openai.com/c/announcements/6.rss",
-        "method": "rss",
-        "enabled": True,
-    },
-    {
-        "name": "openai_release_sitemap",
-        "provider": "openai",
-        "url": "https://openai.com/sitemap.xml/release/",
-        "method": "sitemap",
-        "enabled": True,
-    },
-    {
-        "name": "openai_python_sdk",
-        "provider": "openai",
-        "url": "https://github.com/openai/openai-python/releases.atom",
-        "method": "atom",
-        "enabled": True,
-    },
-    {
-        "name": "openai_status",
-        "provider": "openai",
-        "url": "https://status.openai.com/feed.rss",
-        "method": "rss",
-        "enabled": True,
-    },
+    SourceConfig(
+        name="openai_blog",
+        provider="openai",
+        url="https://openai.com/blog/rss.xml",
+        method="rss",
+        enabled=True,
+    ),
+    SourceConfig(
+        name="openai_changelog",
+        provider="openai",
+        url="https://developers.openai.com/changelog/rss.xml",
+        method="rss",
+        enabled=True,
+    ),
+    SourceConfig(
+        name="openai_community",
+        provider="openai",
+        url="https://community.openai.com/c/announcements/6.rss",
+        method="rss",
+        enabled=True,
+    ),
+    SourceConfig(
+        name="openai_release_sitemap",
+        provider="openai",
+        url="https://openai.com/sitemap.xml/release/",
+        method="sitemap",
+        enabled=True,
+    ),
+    SourceConfig(
+        name="openai_python_sdk",
+        provider="openai",
+        url="https://github.com/openai/openai-python/releases.atom",
+        method="atom",
+        enabled=True,
+    ),
+    SourceConfig(
+        name="openai_status",
+        provider="openai",
+        url="https://status.openai.com/feed.rss",
+        method="rss",
+        enabled=True,
+    ),
     # --- Google Gemini ---
-    {
-        "name": "google_ai_blog",
-        "provider": "gemini",
-        "url": "https://blog.google/technology/ai/rss/",
-        "method": "rss",
-        "enabled": True,
-    },
-    {
-        "name": "google_developers_blog",
-        "provider": "gemini",
-        "url": "https://developers.googleblog.com/feeds/posts/default",
-        "method": "rss",
-        "enabled": True,
-    },
-    {
-        "name": "gemini_api_changelog",
-        "provider": "gemini",
-        "url": "https://ai.google.dev/gemini-api/docs/changelog",
-        "method": "scrape",
-        "css_selector": "article",
-        "enabled": True,
-    },
-    {
-        "name": "vertex_ai_release_notes",
-        "provider": "gemini",
-        "url": "https://docs.cloud.google.com/feeds/generative-ai-on-vertex-ai-release-notes.xml",
-        "method": "atom",
-        "enabled": True,
-    },
-    {
-        "name": "gemini_sitemap",
-        "provider": "gemini",
-        "url": "https://ai.google.dev/sitemap.xml",
-        "method": "sitemap",
-        "enabled": True,
-    },
-]
+    SourceConfig(
+        name="google_ai_blog",
+        provider="gemini",
+        url="https://blog.google/technology/ai/rss/",
+        method="rss",
+        enabled=True,
+    ),
+    SourceConfig(
+        name="google_developers_blog",
+        provider="gemini",
+        url="https://developers.googleblog.com/feeds/posts/default",
+        method="rss",
+        enabled=True,
+    ),
+    SourceConfig(
+        name="gemini_api_changelog",
+        provider="gemini",
+        url="https://ai.google.dev/gemini-api/docs/changelog",
+        method="scrape",
+        css_selector="article",
+        enabled=True,
+    ),
+    SourceConfig(
+        name="vertex_ai_release_notes",
+        provider="gemini",
+        url="https://docs.cloud.google.com/feeds/generative-ai-on-vertex-ai-release-notes.xml",
+        method="atom",
+        enabled=True,
+    ),
+    SourceConfig(
+        name="gemini_sitemap",
+        provider="gemini",
+        url="https://ai.google.dev/sitemap.xml",
+        method="sitemap",
+        enabled=True,
+    ),
+)
 
 # ── Claude API ─────────────────────────────────────────
 CLAUDE_MODEL = "claude-sonnet-4-6"
 SUMMARIZE_MAX_TOKENS = 16384
 SUMMARIZE_TEMPERATURE = 0.3
+SUMMARIZE_CACHE_ENABLED = os.environ.get("SUMMARIZE_CACHE", "1") != "0"
+SUMMARIZE_CACHE_TTL_S = 24 * 60 * 60  # re-runs reuse a summary; next week's run doesn't
 SCRIPTGEN_MAX_TOKENS = 8192
 SCRIPTGEN_TEMPERATURE = 0.7
 
@@ -170,10 +192,12 @@ EXPERT_VOICE = {
     "ssml_gender": "MALE",
 }
 TTS_CHUNK_BYTE_LIMIT = 4800
+TTS_SAMPLE_RATE_HZ = 24000
+TTS_CONCURRENCY = 8  # TTS chunks synthesized in parallel
 
 # ── Audio ──────────────────────────────────────────────
 PAUSE_BETWEEN_SPEAKERS_MS = 400
-MP3_BITRATE = 128000
+MP3_BITRATE = 32000  # Google TTS MP3 output; episodes are stream-copied, not re-encoded
 
 # ── Episode ────────────────────────────────────────────
 EPISODE_TARGET_WORDS = (1500, 2000)
@@ -195,6 +219,7 @@ SUBSTACK_PER_SEGMENT_TARGET_WORDS = 750
 SUBSTACK_FEED_DIR = "site/substack"
 SUBSTACK_PODCAST_TITLE = "Substack PM Weekly"
 SUBSTACK_MAX_NEWSLETTERS_PER_RUN = 10  # backstop: keep most-recent N if more arrive in a week
+SUBSTACK_SUMMARIZE_CONCURRENCY = 4  # per-newsletter Claude calls in flight at once
 STATE_DIR = "state"
 SUBSTACK_SEEN_FILE = "state/substack_seen.json"
 ACTION_ITEMS_COUNT = 3
@@ -1,39 +1,48 @@
 import hashlib
-import json
 import logging
 import subprocess
 from datetime import datetime, timezone
+from functools import cache
 from pathlib import Path
 
+import orjson
+
 from src.config import ROOT_DIR
 
 logger = logging.getLogger(__name__)
 
 SNAPSHOTS_DIR = ROOT_DIR / "snapshots"
+SNAPSHOT_REF = "origin/snapshots"
+
+_snapshot_cache: dict[str, dict | None] = {}
+
+
+def warm_snapshot_cache(source_names: list[str]) -> None:
+    """Read the previous snapshots for all source_names in one git process.
+
+    One fork for the whole run instead of one per source. Results are
+    memoized for load_previous_snapshot; on failure the cache is left cold
+    and each source falls back to its own read.
+    """
+    _snapshot_cache.clear()
+    _snapshot_cache.update(_read_snapshots(source_names))
 
 
 def load_previous_snapshot(source_name: str) -> dict | None:
     """Read the previous snapshot from the snapshots branch via:
-      git show origin/snapshots:snapshots/{source_name}.json
+      git cat-file --batch  (stdin: origin/snapshots:snapshots/{source_name}.json)
 
+    Served from the warm_snapshot_cache batch read when available.
     Returns parsed JSON dict, or None if branch/file doesn't exist.
     No branch checkout — reads the blob directly.
     """
-    blob_path = f"snapshots/{source_name}.json"
-    try:
-        result = subprocess.run(
-            ["git", "show", f"origin/snapshots:{blob_path}"],
-            capture_output=True,
-            text=True,
-            cwd=ROOT_DIR,
-        )
-        if result.returncode != 0:
-            logger.info("No previous snapshot for %s (branch or file missing)", source_name)
-            return None
-        return json.loads(result.stdout)
-    except (json.JSONDecodeError, Exception) as e:
-        logger.warning("Failed to load snapshot for %s: %s", source_name, e)
-        return None
+    if source_name not in _snapshot_cache:
+        _snapshot_cache.update(_read_snapshots([source_name]))
+
+    previous = _snapshot_cache.get(source_name)
+    if previous is None:
+        logger.info("No previous snapshot for %s (branch or file missing)", source_name)
+    return previous
 
 
 def save_snapshot(source_name: str, data: dict) -> None:
@@ -41,9 +50,9 @@ def save_snapshot(source_name: str, data: dict) -> None:
 
     The GitHub Actions workflow handles committing this to the snapshots branch.
     """
-    SNAPSHOTS_DIR.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(SNAPSHOTS_DIR)
     path = SNAPSHOTS_DIR / f"{source_name}.json"
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False))
+    path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
     logger.info("Saved snapshot for %s to %s", source_name, path)
 
 
@@ -58,20 +67,20 @@ def diff_scrape(source_name: str, current_text: str) -> str | None:
 
     previous = load_previous_snapshot(source_name)
 
-    # Save current snapshot regardless
+    if previous is not None and previous.get("content_hash") == current_hash:
+        # Unchanged — skip the save; the workflow overlays new snapshots onto
+        # origin/snapshots, so the existing blob is kept as is
+        return None
+
+    # raw_text goes to a sibling .txt so the JSON read back on the next run
+    # (only content_hash is compared) stays a few bytes, not the whole page
     save_snapshot(source_name, {
         "fetched_at": now,
         "content_hash": current_hash,
-        "raw_text": current_text,
     })
+    _save_snapshot_text(source_name, current_text)
 
-    if previous is None:
-        # First run — treat everything as new
-        return current_text
-
-    if previous.get("content_hash") == current_hash:
-        return None
-
+    # First run or changed — treat everything as new
     return current_text
 
 
@@ -96,16 +105,18 @@ def diff_sitemap(source_name: str, current_urls: dict[str, str | None]) -> list[
         return list(current_urls.keys())
 
     prev_urls = previous.get("urls", {})
-    new_urls = []
 
-    for url, lastmod in current_urls.items():
-        if url not in prev_urls:
-            new_urls.append(url)
-        elif lastmod and lastmod != prev_urls.get(url):
-            # lastmod changed — content was updated
-            new_urls.append(url)
+    # (url, lastmod) pairs not in the previous snapshot — new URLs, or known
+    # URLs whose lastmod changed. Set difference on the item views runs in C.
+    changed = current_urls.items() - prev_urls.items()
+    if not changed:
+        return []
 
-    return new_urls
+    # Keep sitemap order; a lastmod dropped to None is not an update
+    return [
+        url for url, lastmod in current_urls.items()
+        if (url, lastmod) in changed and (lastmod or url not in prev_urls)
+    ]
 
 
 def diff_models(source_name: str, current_models: list[dict]) -> list[dict]:
@@ -129,3 +140,64 @@ def diff_models(source_name: str, current_models: list[dict]) -> list[dict]:
 
     prev_ids = {m["id"] for m in previous.get("models", [])}
     return [m for m in current_models if m["id"] not in prev_ids]
+
+
+# ── Helpers ────────────────────────────────────────────
+
+
+@cache
+def _ensure_dir(path: Path) -> None:
+    """mkdir -p once per directory per process (every snapshot save lands here)."""
+    path.mkdir(parents=True, exist_ok=True)
+
+
+def _save_snapshot_text(source_name: str, text: str) -> None:
+    """Write scraped text to snapshots/{source_name}.txt next to its JSON snapshot."""
+    _ensure_dir(SNAPSHOTS_DIR)
+    (SNAPSHOTS_DIR / f"{source_name}.txt").write_text(text)
+
+
+def _read_snapshots(source_names: list[str]) -> dict[str, dict | None]:
+    """Batch-read snapshot blobs with `git cat-file --batch`.
+
+    Returns {name: parsed dict, or None if missing/unparseable}. Returns an
+    empty dict if git itself fails, so nothing is memoized.
+    """
+    if not source_names:
+        return {}
+
+    request = "".join(f"{SNAPSHOT_REF}:snapshots/{name}.json\n" for name in source_names)
+    try:
+        result = subprocess.run(
+            ["git", "cat-file", "--batch"],
+            input=request.encode(),
+            capture_output=True,
+            cwd=ROOT_DIR,
+        )
+    except OSError as e:
+        logger.warning("Failed to read snapshots: %s", e)
+        return {}
+    if result.returncode != 0:
+        logger.warning("Failed to read snapshots: %s", result.stderr.decode(errors="replace").strip())
+        return {}
+
+    # Output framing per object: "<sha> blob <size>\n<payload>\n" or "<object> missing\n"
+    snapshots: dict[str, dict | None] = {}
+    out = result.stdout
+    pos = 0
+    for name in source_names:
+        header_end = out.index(b"\n", pos)
+        header = out[pos:header_end].split()
+        pos = header_end + 1
+        if len(header) != 3:
+            snapshots[name] = None
+            continue
+        size = int(header[2])
+        payload = out[pos:pos + size]
+        pos += size + 1
+        try:
+            snapshots[name] = orjson.loads(payload)
+        except orjson.JSONDecodeError as e:
+            logger.warning("Failed to load snapshot for %s: %s", name, e)
+            snapshots[name] = None
+    return snapshots
@@ -0,0 +1,72 @@
+import hashlib
+import logging
+from pathlib import Path
+
+import orjson
+import requests
+
+from src.config import HTTP_CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+
+def conditional_get(session: requests.Session, url: str, timeout: float) -> bytes:
+    """GET url, revalidating against the last 200 response with
+    If-None-Match / If-Modified-Since.
+
+    On 304 the cached body is returned, so callers parse and filter it exactly
+    as if it had been downloaded. Per-URL files under HTTP_CACHE_DIR:
+      {key}.json  — {"url", "etag", "last_modified"}
+      {key}.body  — raw response body
+    Raises on HTTP errors (caller handles).
+    """
+    meta_path, body_path = _cache_paths(url)
+    meta = _load_meta(meta_path) if body_path.exists() else {}
+
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+
+    resp = session.get(url, headers=headers, timeout=timeout)
+    if resp.status_code == 304 and headers:
+        logger.info("Not modified, using cached body: %s", url)
+        return body_path.read_bytes()
+    resp.raise_for_status()
+
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    if etag or last_modified:
+        _store(meta_path, body_path, {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+        }, resp.content)
+    return resp.content
+
+
+# ── Helpers ────────────────────────────────────────────
+
+
+def _cache_paths(url: str) -> tuple[Path, Path]:
+    key = hashlib.sha256(url.encode()).hexdigest()[:16]
+    return HTTP_CACHE_DIR / f"{key}.json", HTTP_CACHE_DIR / f"{key}.body"
+
+
+def _load_meta(meta_path: Path) -> dict:
+    try:
+        return orjson.loads(meta_path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+
+
+def _store(meta_path: Path, body_path: Path, meta: dict, body: bytes) -> None:
+    """Write body before validators, so a validator never points at a stale body."""
+    try:
+        HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        meta_path.unlink(missing_ok=True)
+        body_path.write_bytes(body)
+        meta_path.write_bytes(orjson.dumps(meta))
+    except OSError as e:
+        logger.warning("Failed to cache %s: %s", meta["url"], e)
@@ -1,47 +1,104 @@
+import html
+import io
 import logging
+import re
+import threading
+from calendar import timegm
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from urllib.parse import urlparse
 
 import feedparser
+import orjson
 import requests
-from bs4 import BeautifulSoup
 from lxml import etree
+from lxml.cssselect import CSSSelector
 
-from src.config import ANTHROPIC_API_KEY
-from src.diff import diff_models, diff_scrape, diff_sitemap
+from src.config import ANTHROPIC_API_KEY, SourceConfig
+from src.diff import diff_models, diff_scrape, diff_sitemap, warm_snapshot_cache
+from src.http_cache import conditional_get
+from src.ratelimit import CappedRetry, HostLimiter, RateLimitedAdapter
 
 logger = logging.getLogger(__name__)
 
 USER_AGENT = "AIPodcastBot/1.0"
 REQUEST_TIMEOUT = 30
 MAX_SITEMAP_ITEMS = 100  # Safety cap per sitemap source
+MAX_INGEST_WORKERS = 16
+SNAPSHOT_METHODS = ("scrape", "sitemap", "api")  # diffed against origin/snapshots
+PER_HOST_CONCURRENCY = 4  # several sources share a host (e.g. github.com)
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+SITEMAP_NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+
+# Tags start with a letter, "/", "!" or "?" — so "a < b > c" in plain text survives
+_TAG_RE = re.compile(r"<[a-zA-Z/!?][^>]*>")
+_CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+_META_CHARSET_RE = re.compile(rb"<meta[^>]+charset=", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Clark-notation tags, built once rather than per element. lxml already caches
+# the compiled find()/findtext() paths, so plain strings are all that's needed.
+_SM_URL, _SM_SITEMAP, _SM_LOC, _SM_LASTMOD = (
+    SITEMAP_NS + tag for tag in ("url", "sitemap", "loc", "lastmod")
+)
+_ATOM_FEED, _ATOM_ENTRY, _ATOM_TITLE, _ATOM_LINK = (
+    ATOM_NS + tag for tag in ("feed", "entry", "title", "link")
+)
+_ATOM_SUMMARY, _ATOM_CONTENT, _ATOM_PUBLISHED, _ATOM_UPDATED = (
+    ATOM_NS + tag for tag in ("summary", "content", "published", "updated")
+)
+_RSS_CONTENT = "{http://purl.org/rss/1.0/modules/content/}encoded"
+_RSS_DC_DATE = "{http://purl.org/dc/elements/1.1/}date"
+
+_host_semaphores: dict[str, threading.BoundedSemaphore] = {}
+_host_semaphores_lock = threading.Lock()
+
+# Shared across ingest workers so requests to the same host reuse
+# keep-alive connections; one pooled connection per concurrent request.
+# Transient upstream errors are retried with backoff (honouring Retry-After,
+# capped at ratelimit.MAX_PAUSE_S);
+# the final response is still returned, so raise_for_status() behaves as before.
+# A host that still signals a rate limit is paused for the other workers too.
+_host_limiter = HostLimiter()
+_session = requests.Session()
+_session.headers["User-Agent"] = USER_AGENT
+_session.mount("https://", RateLimitedAdapter(
+    _host_limiter,
+    pool_connections=MAX_INGEST_WORKERS,
+    pool_maxsize=PER_HOST_CONCURRENCY,
+    max_retries=CappedRetry(
+        total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504], raise_on_status=False,
+    ),
+))
 
 
 def fetch_rss(url: str, since_days: int = 7) -> list[dict]:
     """Parse an RSS feed and return items published within `since_days`.
 
-    Uses feedparser. Each returned dict is a ContentItem.
+    Fetched with a conditional GET (http_cache), parsed with lxml; feedparser
+    is the fallback for feeds lxml can't read. Each returned dict is a
+    ContentItem.
     Returns empty list on any failure (logged as warning).
     """
     try:
-        feed = feedparser.parse(url)
-        if feed.bozo and not feed.entries:
-            logger.warning("RSS parse error for %s: %s", url, feed.bozo_exception)
+        entries = _fetch_feed_entries(url)
+        if entries is None:
             return []
 
-        cutoff = datetime.now(timezone.utc) - timedelta(days=since_days)
+        now = datetime.now(timezone.utc)
+        cutoff = now - timedelta(days=since_days)
+        now_iso = now.isoformat()
         items = []
-        for entry in feed.entries:
-            published = _parse_feed_date(entry)
-            if published and published < cutoff:
-                continue
-
+        for entry in _recent_entries(entries, cutoff):
+            published = entry["published"]
             items.append({
-                "title": entry.get("title", ""),
-                "url": entry.get("link", ""),
-                "summary": _truncate(
-                    entry.get("summary", entry.get("description", "")), 500
-                ),
-                "published": published.isoformat() if published else datetime.now(timezone.utc).isoformat(),
+                "title": entry["title"],
+                "url": entry["link"],
+                "summary": _truncate(entry["summary"], 500),
+                "published": published.isoformat() if published else now_iso,
                 "source_name": "",  # filled by ingest_all
                 "provider": "",     # filled by ingest_all
                 "method": "rss",
@@ -58,30 +115,22 @@ def fetch_atom(url: str, since_days: int = 7) -> list[dict]:
     Same return format as fetch_rss. GitHub Atom feeds use <updated> not <published>.
     """
     try:
-        feed = feedparser.parse(url)
-        if feed.bozo and not feed.entries:
-            logger.warning("Atom parse error for %s: %s", url, feed.bozo_exception)
+        entries = _fetch_feed_entries(url)
+        if entries is None:
             return []
 
-        cutoff = datetime.now(timezone.utc) - timedelta(days=since_days)
+        now = datetime.now(timezone.utc)
+        cutoff = now - timedelta(days=since_days)
+        now_iso = now.isoformat()
         items = []
-        for entry in feed.entries:
-            # GitHub Atom feeds use 'updated' rather than 'published'
-            published = _parse_feed_date(entry)
-            if published and published < cutoff:
-                continue
-
-            content = ""
-            if hasattr(entry, "content") and entry.content:
-                content = entry.content[0].get("value", "")
-            elif hasattr(entry, "summary"):
-                content = entry.summary or ""
-
+        # GitHub Atom feeds use 'updated' rather than 'published'
+        for entry in _recent_entries(entries, cutoff):
+            published = entry["published"]
             items.append({
-                "title": entry.get("title", ""),
-                "url": entry.get("link", ""),
-                "summary": _truncate(content, 500),
-                "published": published.isoformat() if published else datetime.now(timezone.utc).isoformat(),
+                "title": entry["title"],
+                "url": entry["link"],
+                "summary": _truncate(entry["content"] or entry["summary"], 500),
+                "published": published.isoformat() if published else now_iso,
                 "source_name": "",
                 "provider": "",
                 "method": "atom",
@@ -93,62 +142,77 @@ def fetch_atom(url: str, since_days: int = 7) -> list[dict]:
 
 
 def scrape_page(url: str, css_selector: str) -> str:
-    """Fetch a page with requests, extract text via BeautifulSoup + css_selector.
+    """Fetch a page with requests, extract text via lxml's HTML parser + css_selector.
 
     Returns the extracted text as a string.
     Raises on HTTP errors (caller handles).
     """
-    resp = requests.get(
-        url, headers={"User-Agent": USER_AGENT}, timeout=REQUEST_TIMEOUT
-    )
+    resp = _session.get(url, timeout=REQUEST_TIMEOUT)
     resp.raise_for_status()
-    soup = BeautifulSoup(resp.text, "lxml")
-    elements = soup.select(css_selector)
-    return "\n".join(el.get_text(separator=" ", strip=True) for el in elements)
+    # Hand lxml the raw bytes: resp.text would run charset detection over the
+    # whole page (or, for text/* without a charset, wrongly assume Latin-1)
+    root = _parse_html(resp.content, _page_encoding(resp))
+    if root is None:
+        return ""
+    elements = CSSSelector(css_selector, translator="html")(root)
+    return "\n".join(_element_text(el) for el in elements)
 
 
 def fetch_sitemap(url: str) -> dict[str, str | None]:
     """Parse a sitemap XML and return {url: lastmod_or_None} dict.
 
-    Handles sitemap index files (recursive fetch of child sitemaps).
+    Handles sitemap index files (child sitemaps fetched concurrently, at most
+    PER_HOST_CONCURRENCY at a time). Fetched with a conditional GET (http_cache) and streamed with iterparse,
+    clearing each <url> once read, so multi-MB sitemaps never build a full tree.
     """
-    resp = requests.get(
-        url, headers={"User-Agent": USER_AGENT}, timeout=REQUEST_TIMEOUT
-    )
-    resp.raise_for_status()
-
-    root = etree.fromstring(resp.content)
-    ns = {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9"}
+    body = conditional_get(_session, url, REQUEST_TIMEOUT)
 
-    # Check if this is a sitemap index
-    sitemaps = root.findall("sm:sitemap", ns)
-    if sitemaps:
+    urls = {}
+    child_sitemaps = []
+    for _, elem in etree.iterparse(
+        io.BytesIO(body),
+        tag=(_SM_URL, _SM_SITEMAP),
+        resolve_entities=False,
+        no_network=True,
+    ):
+        loc = elem.findtext(_SM_LOC)
+        if loc:
+            if elem.tag == _SM_SITEMAP:
+                child_sitemaps.append(loc)
+            else:
+                urls[loc] = elem.findtext(_SM_LASTMOD)
+        # Drop the element and its already-processed siblings
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+    # Sitemap index — fetch the child sitemaps concurrently, merge in index order
+    if child_sitemaps:
         result = {}
-        for sitemap in sitemaps:
-            loc = sitemap.findtext("sm:loc", namespaces=ns)
-            if loc:
-                try:
-                    result.update(fetch_sitemap(loc))
-                except Exception as e:
-                    logger.warning("Failed to fetch child sitemap %s: %s", loc, e)
+        workers = min(PER_HOST_CONCURRENCY, len(child_sitemaps))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for child_urls in executor.map(_safe_fetch_sitemap, child_sitemaps):
+                result.update(child_urls)
         return result
 
-    # Regular sitemap
-    urls = {}
-    for url_elem in root.findall("sm:url", ns):
-        loc = url_elem.findtext("sm:loc", namespaces=ns)
-        lastmod = url_elem.findtext("sm:lastmod", namespaces=ns)
-        if loc:
-            urls[loc] = lastmod
     return urls
 
 
+def _safe_fetch_sitemap(url: str) -> dict[str, str | None]:
+    """fetch_sitemap for a child sitemap; a failure is logged and yields {}."""
+    try:
+        return fetch_sitemap(url)
+    except Exception as e:
+        logger.warning("Failed to fetch child sitemap %s: %s", url, e)
+        return {}
+
+
 def fetch_anthropic_models(api_key: str) -> list[dict]:
     """Call GET https://api.anthropic.com/v1/models with the API key.
 
     Returns list of model dicts (id, display_name, created_at).
     """
-    resp = requests.get(
+    resp = _session.get(
         "https://api.anthropic.com/v1/models",
         headers={
             "x-api-key": api_key,
@@ -157,7 +221,7 @@ def fetch_anthropic_models(api_key: str) -> list[dict]:
         timeout=REQUEST_TIMEOUT,
     )
     resp.raise_for_status()
-    data = resp.json()
+    data = orjson.loads(resp.content)
     return [
         {
             "id": m["id"],
@@ -168,9 +232,13 @@ def fetch_anthropic_models(api_key: str) -> list[dict]:
     ]
 
 
-def ingest_all(sources: list[dict], since_days: int = 7) -> dict:
-    """Iterate over all enabled sources, dispatch to the correct fetcher,
-    and return grouped results.
+def ingest_all(sources: Iterable[SourceConfig], since_days: int = 7) -> dict:
+    """Fetch all enabled sources concurrently, dispatch to the correct
+    fetcher, and return grouped results.
+
+    Sources are fetched on a thread pool (the work is network-bound), with
+    at most PER_HOST_CONCURRENCY requests in flight per hostname. Results
+    are merged in source order so output is deterministic.
 
     Per-source try/except — log warning, append to errors, continue.
     """
@@ -181,107 +249,31 @@ def ingest_all(sources: list[dict], since_days: int = 7) -> dict:
         "errors": [],
     }
 
-    for source in sources:
-        if not source.get("enabled", True):
-            continue
+    enabled = [s for s in sources if s.enabled]
+    if not enabled:
+        return output
 
-        name = source["name"]
-        provider = source["provider"]
-        method = source["method"]
-        url = source["url"]
-
-        try:
-            if method == "rss":
-                items = fetch_rss(url, since_days)
-            elif method == "atom":
-                items = fetch_atom(url, since_days)
-            elif method == "scrape":
-                text = scrape_page(url, source.get("css_selector", "body"))
-                if not text.strip():
-                    items = []
-                else:
-                    # Diff against previous snapshot — None means unchanged
-                    try:
-                        diffed = diff_scrape(name, text)
-                    except Exception as e:
-                        logger.warning("Diff failed for %s, using raw text: %s", name, e)
-                        diffed = text
-                    if diffed is None:
-                        items = []
-                    else:
-                        items = [
-                            {
-                                "title": name,
-                                "url": url,
-                                "summary": _truncate(diffed, 500),
-                                "published": datetime.now(timezone.utc).isoformat(),
-                                "source_name": name,
-                                "provider": provider,
-                                "method": "scrape",
-                            }
-                        ]
-            elif method == "sitemap":
-                url_map = fetch_sitemap(url)
-                # Diff against previous snapshot — only new/changed URLs
-                try:
-                    new_urls = diff_sitemap(name, url_map)
-                except Exception as e:
-                    logger.warning("Diff failed for %s, using date filter only: %s", name, e)
-                    new_urls = list(url_map.keys())
+    # One batched git read for every snapshot the diffing methods will need
+    warm_snapshot_cache([s.name for s in enabled if s.method in SNAPSHOT_METHODS])
 
-                # Filter by lastmod date (within since_days)
-                cutoff = datetime.now(timezone.utc) - timedelta(days=since_days)
-                items = []
-                for u in new_urls:
-                    lastmod = url_map.get(u)
-                    if lastmod:
-                        parsed_dt = _parse_lastmod(lastmod)
-                        if parsed_dt and parsed_dt < cutoff:
-                            continue
-                    else:
-                        # No lastmod — skip if no snapshot exists (first run)
-                        # Diff already handled subsequent runs
-                        continue
+    with ThreadPoolExecutor(max_workers=min(MAX_INGEST_WORKERS, len(enabled))) as executor:
+        futures = [
+            (source, executor.submit(_fetch_source, source, since_days))
+            for source in enabled
+        ]
 
-                    items.append({
-                        "title": u.split("/")[-1] or u,
-                        "url": u,
-                        "summary": "",
-                        "published": lastmod or datetime.now(timezone.utc).isoformat(),
-                        "source_name": name,
-                        "provider": provider,
-                        "method": "sitemap",
-                    })
-
-                # Safety cap
-                if len(items) > MAX_SITEMAP_ITEMS:
-                    logger.warning(
-                        "Capping %s from %d to %d items",
-                        name, len(items), MAX_SITEMAP_ITEMS,
-                    )
-                    items = items[:MAX_SITEMAP_ITEMS]
-            elif method == "api":
-                models = fetch_anthropic_models(ANTHROPIC_API_KEY)
-                # Diff against previous snapshot — only new models
-                try:
-                    new_models = diff_models(name, models)
-                except Exception as e:
-                    logger.warning("Diff failed for %s, using all models: %s", name, e)
-                    new_models = models
-                items = [
-                    {
-                        "title": m["display_name"],
-                        "url": url,
-                        "summary": f"Model {m['id']} (created {m.get('created_at', 'unknown')})",
-                        "published": m.get("created_at", datetime.now(timezone.utc).isoformat()),
-                        "source_name": name,
-                        "provider": provider,
-                        "method": "api",
-                    }
-                    for m in new_models
-                ]
-            else:
-                logger.warning("Unknown method '%s' for source %s", method, name)
+        for source, future in futures:
+            name = source.name
+            provider = source.provider
+
+            try:
+                items = future.result()
+            except Exception as e:
+                logger.warning("Source %s failed: %s", name, e)
+                output["errors"].append({"source": name, "error": str(e)})
+                continue
+
+            if items is None:
                 continue
 
             # Stamp source_name and provider on rss/atom items
@@ -294,23 +286,276 @@ def ingest_all(sources: list[dict], since_days: int = 7) -> dict:
             output[provider].extend(items)
             logger.info("Source %s: %d items", name, len(items))
 
-        except Exception as e:
-            logger.warning("Source %s failed: %s", name, e)
-            output["errors"].append({"source": name, "error": str(e)})
-
     return output
 
 
+def _fetch_source(source: SourceConfig, since_days: int) -> list[dict] | None:
+    """Fetch and diff a single source. Runs on an ingest worker thread.
+
+    Returns None for an unknown method (logged, not treated as an error).
+    Raises on fetch failure (ingest_all records it).
+    """
+    name = source.name
+    provider = source.provider
+    method = source.method
+    url = source.url
+    now = datetime.now(timezone.utc)
+    now_iso = now.isoformat()
+
+    with _host_semaphore(url):
+        if method == "rss":
+            items = fetch_rss(url, since_days)
+        elif method == "atom":
+            items = fetch_atom(url, since_days)
+        elif method == "scrape":
+            text = scrape_page(url, source.css_selector)
+            if not text.strip():
+                items = []
+            else:
+                # Diff against previous snapshot — None means unchanged
+                try:
+                    diffed = diff_scrape(name, text)
+                except Exception as e:
+                    logger.warning("Diff failed for %s, using raw text: %s", name, e)
+                    diffed = text
+                if diffed is None:
+                    items = []
+                else:
+                    items = [
+                        {
+                            "title": name,
+                            "url": url,
+                            "summary": _truncate(diffed, 500),
+                            "published": now_iso,
+                            "source_name": name,
+                            "provider": provider,
+                            "method": "scrape",
+                        }
+                    ]
+        elif method == "sitemap":
+            url_map = fetch_sitemap(url)
+            # Diff against previous snapshot — only new/changed URLs
+            try:
+                new_urls = diff_sitemap(name, url_map)
+            except Exception as e:
+                logger.warning("Diff failed for %s, using date filter only: %s", name, e)
+                new_urls = list(url_map.keys())
+
+            # Filter by lastmod date (within since_days)
+            cutoff = now - timedelta(days=since_days)
+            items = []
+            for u in new_urls:
+                lastmod = url_map.get(u)
+                if lastmod:
+                    parsed_dt = _parse_lastmod(lastmod)
+                    if parsed_dt and parsed_dt < cutoff:
+                        continue
+                else:
+                    # No lastmod — skip if no snapshot exists (first run)
+                    # Diff already handled subsequent runs
+                    continue
+
+                items.append({
+                    "title": u.split("/")[-1] or u,
+                    "url": u,
+                    "summary": "",
+                    "published": lastmod or now_iso,
+                    "source_name": name,
+                    "provider": provider,
+                    "method": "sitemap",
+                })
+
+            # Safety cap
+            if len(items) > MAX_SITEMAP_ITEMS:
+                logger.warning(
+                    "Capping %s from %d to %d items",
+                    name, len(items), MAX_SITEMAP_ITEMS,
+                )
+                items = items[:MAX_SITEMAP_ITEMS]
+        elif method == "api":
+            models = fetch_anthropic_models(ANTHROPIC_API_KEY)
+            # Diff against previous snapshot — only new models
+            try:
+                new_models = diff_models(name, models)
+            except Exception as e:
+                logger.warning("Diff failed for %s, using all models: %s", name, e)
+                new_models = models
+            items = [
+                {
+                    "title": m["display_name"],
+                    "url": url,
+                    "summary": f"Model {m['id']} (created {m.get('created_at', 'unknown')})",
+                    "published": m.get("created_at", now_iso),
+                    "source_name": name,
+                    "provider": provider,
+                    "method": "api",
+                }
+                for m in new_models
+            ]
+        else:
+            logger.warning("Unknown method '%s' for source %s", method, name)
+            return None
+
+    return items
+
+
+def _host_semaphore(url: str) -> threading.BoundedSemaphore:
+    """Return the shared per-hostname semaphore for url, creating it on first use."""
+    host = urlparse(url).hostname or ""
+    with _host_semaphores_lock:
+        sem = _host_semaphores.get(host)
+        if sem is None:
+            sem = _host_semaphores[host] = threading.BoundedSemaphore(PER_HOST_CONCURRENCY)
+        return sem
+
+
 # ── Helpers ────────────────────────────────────────────
 
+def _fetch_feed_entries(url: str) -> list[dict] | None:
+    """Fetch an RSS/Atom feed and return normalized entries:
+    {title, link, summary, content, published (aware datetime | None)}.
+
+    Returns None if the feed can't be parsed at all (logged as warning).
+    """
+    body = conditional_get(_session, url, REQUEST_TIMEOUT)
+    entries = _parse_feed_fast(body)
+    if entries is not None:
+        return entries
+
+    feed = feedparser.parse(body)
+    if feed.bozo and not feed.entries:
+        logger.warning("Feed parse error for %s: %s", url, feed.bozo_exception)
+        return None
+    return [_feedparser_entry(entry) for entry in feed.entries]
+
+
+def _recent_entries(entries: list[dict], cutoff: datetime) -> Iterator[dict]:
+    """Yield entries not older than cutoff (undated entries are kept).
+
+    When the first two dated entries are newest-first — as most feeds are —
+    the first too-old entry ends the scan instead of walking the archive.
+    """
+    dated = [e["published"] for e in entries[:2] if e["published"]]
+    newest_first = len(dated) == 2 and dated[0] >= dated[1]
+    for entry in entries:
+        published = entry["published"]
+        if published and published < cutoff:
+            if newest_first:
+                return
+            continue
+        yield entry
+
+
+def _parse_feed_fast(body: bytes) -> list[dict] | None:
+    """Parse RSS 2.0 / Atom with lxml, reading only the fields ingest uses.
+
+    Returns None for anything else (malformed XML, RSS 1.0/RDF, …) so the
+    caller can fall back to feedparser.
+    """
+    try:
+        # A parser per call — lxml parser objects must not be shared across threads
+        parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False, no_network=True)
+        root = etree.fromstring(body, parser=parser)
+    except (etree.XMLSyntaxError, ValueError):
+        return None
+
+    # Like feedparser, an entry with only full content uses it as its summary
+    if root.tag == "rss":
+        entries = []
+        for item in root.iter("item"):
+            content = item.findtext(_RSS_CONTENT) or ""
+            entries.append({
+                "title": item.findtext("title") or "",
+                "link": (item.findtext("link") or "").strip(),
+                "summary": item.findtext("description") or content,
+                "content": content,
+                "published": (
+                    _parse_rfc822(item.findtext("pubDate"))
+                    or _parse_lastmod(item.findtext(_RSS_DC_DATE) or "")
+                ),
+            })
+        return entries
+
+    if root.tag == _ATOM_FEED:
+        entries = []
+        for entry in root.iter(_ATOM_ENTRY):
+            content = _atom_text(entry.find(_ATOM_CONTENT))
+            entries.append({
+                "title": _atom_text(entry.find(_ATOM_TITLE)),
+                "link": _atom_link(entry),
+                "summary": _atom_text(entry.find(_ATOM_SUMMARY)) or content,
+                "content": content,
+                "published": _parse_lastmod(
+                    entry.findtext(_ATOM_PUBLISHED)
+                    or entry.findtext(_ATOM_UPDATED)
+                    or ""
+                ),
+            })
+        return entries
+
+    return None
+
+
+def _feedparser_entry(entry) -> dict:
+    """Normalize a feedparser entry to the _parse_feed_fast shape."""
+    content = ""
+    if hasattr(entry, "content") and entry.content:
+        content = entry.content[0].get("value", "")
+    return {
+        "title": entry.get("title", ""),
+        "link": entry.get("link", ""),
+        "summary": entry.get("summary", entry.get("description", "")) or "",
+        "content": content,
+        "published": _parse_feed_date(entry),
+    }
+
+
+def _atom_text(elem) -> str:
+    """Text of an Atom text construct (type="xhtml" content is nested markup)."""
+    if elem is None:
+        return ""
+    if elem.get("type") == "xhtml":
+        return " ".join(elem.itertext()).strip()
+    return elem.text or ""
+
+
+def _atom_link(entry) -> str:
+    """href of the rel="alternate" link (rel defaults to alternate)."""
+    for link in entry.iter(_ATOM_LINK):
+        if link.get("rel", "alternate") == "alternate":
+            return link.get("href", "")
+    return ""
+
+
+def _parse_rfc822(value: str | None) -> datetime | None:
+    """Parse an RSS pubDate into a timezone-aware datetime."""
+    if not value:
+        return None
+    try:
+        dt = parsedate_to_datetime(value.strip())
+    except (TypeError, ValueError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
 
 def _parse_feed_date(entry) -> datetime | None:
-    """Extract a timezone-aware datetime from a feedparser entry."""
+    """Extract a timezone-aware datetime from a feedparser entry.
+
+    Parses the raw published/updated string directly (RFC 822 for RSS,
+    ISO 8601 for Atom); feedparser's *_parsed struct_time is the fallback.
+    """
+    for field in ("published", "updated"):
+        raw = entry.get(field, "")
+        if raw:
+            parsed = _parse_rfc822(raw) or _parse_lastmod(raw)
+            if parsed:
+                return parsed
     for field in ("published_parsed", "updated_parsed"):
         tp = getattr(entry, field, None)
         if tp:
             try:
-                from calendar import timegm
                 return datetime.fromtimestamp(timegm(tp), tz=timezone.utc)
             except (ValueError, OverflowError):
                 continue
@@ -334,11 +579,50 @@ def _parse_lastmod(lastmod: str) -> datetime | None:
         return None
 
 
+def _page_encoding(resp: requests.Response) -> str | None:
+    """Charset to decode a page with: the Content-Type header's, else None
+    when the page declares one in a <meta> tag (lxml reads it), else UTF-8."""
+    charset = _CHARSET_RE.search(resp.headers.get("Content-Type", ""))
+    if charset:
+        return charset.group(1)
+    # Browsers only look for the <meta> in the first 1024 bytes
+    if _META_CHARSET_RE.search(resp.content[:1024]):
+        return None
+    return "utf-8"
+
+
+def _parse_html(content: bytes, encoding: str | None):
+    """Parse an HTML page with lxml; an unknown declared charset falls back to
+    UTF-8, and encoding=None lets lxml follow the page's <meta> charset.
+    Returns None for an empty document."""
+    try:
+        parser = etree.HTMLParser(encoding=encoding)
+    except LookupError:
+        parser = etree.HTMLParser(encoding="utf-8")
+    return etree.fromstring(content, parser)
+
+
+def _element_text(el) -> str:
+    """Visible text of an element, each text node stripped and joined by a
+    space — what BeautifulSoup's get_text(" ", strip=True) returned."""
+    etree.strip_elements(el, "script", "style", "template", with_tail=False)
+    return " ".join(text.strip() for text in el.itertext() if text.strip())
+
+
+@lru_cache(maxsize=1024)
+def _strip_html(text: str) -> str:
+    """Strip tags and entities from a feed summary. Cached, since the same
+    post is often syndicated on more than one feed."""
+    # Regex, not a parser — these are short feed summaries, and a
+    # BeautifulSoup per entry dominated feed parsing
+    text = _TAG_RE.sub(" ", text)
+    return _WHITESPACE_RE.sub(" ", html.unescape(text)).strip()
+
+
 def _truncate(text: str, max_chars: int) -> str:
     """Truncate text to max_chars, stripping HTML tags first."""
-    # Strip HTML tags if present
     if "<" in text and ">" in text:
-        text = BeautifulSoup(text, "lxml").get_text(separator=" ", strip=True)
+        text = _strip_html(text)
     if len(text) <= max_chars:
         return text
     return text[:max_chars].rsplit(" ", 1)[0] + "..."
@@ -1,12 +1,14 @@
 import argparse
-import json
 import logging
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
-from src.audio import stitch_audio
+import orjson
+
+from src.audio import stitch_audio, warm_silence_cache
 from src.config import (
     EPISODES_DIR,
     LOOKBACK_DAYS,
@@ -19,6 +21,8 @@ from src.config import (
     SUBSTACK_FEED_DIR,
     SUBSTACK_LOOKBACK_DAYS,
     SUBSTACK_PODCAST_TITLE,
+    SUBSTACK_SUMMARIZE_CONCURRENCY,
+    TTS_CACHE_DIR,
 )
 from src.ingest import ingest_all
 from src.publish import (
@@ -53,6 +57,22 @@ def _try_smtp_creds():
         return None
 
 
+def _synthesize_overlapping_silence(segments: list[dict]) -> list[Path]:
+    """Run synthesize_script() while the stitch silence is encoded in the background.
+
+    A failed warm-up is only logged — stitch_audio regenerates the silence
+    itself and hard-fails there if ffmpeg is really broken.
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        silence = executor.submit(warm_silence_cache)
+        segment_paths = synthesize_script(segments, cache_dir=TTS_CACHE_DIR)
+        try:
+            silence.result()
+        except Exception as e:
+            logger.warning("Silence warm-up failed, stitch will retry: %s", e)
+    return segment_paths
+
+
 def run_pipeline(source: str = "ai_industry", dry_run: bool = False) -> dict:
     """Dispatch by source. ai_industry uses the original pipeline; substack_pm
     routes through the new path (full implementation lands in M3)."""
@@ -106,6 +126,9 @@ def _run_ai_industry(dry_run: bool = False) -> dict:
     # ── Stage 2: Summarize ────────────────────────────
     logger.info("Stage 2: Summarizing with Claude API")
     summary = summarize(content)
+    # Raw items aren't needed past this point; free them before script
+    # generation and TTS/ffmpeg raise the process's peak memory
+    del content
 
     themes = summary.get("themes", [])
     result["themes_count"] = len(themes)
@@ -130,7 +153,7 @@ def _run_ai_industry(dry_run: bool = False) -> dict:
 
     # ── Stage 4: TTS ──────────────────────────────────
     logger.info("Stage 4: Synthesizing audio via Google TTS")
-    segment_paths = synthesize_script(segments)
+    segment_paths = _synthesize_overlapping_silence(segments)
     logger.info("Synthesized %d audio segments", len(segment_paths))
 
     # ── Stage 5: Audio Stitching ──────────────────────
@@ -222,9 +245,11 @@ def _run_substack_pm(dry_run: bool = False) -> dict:
     logger.info("Stage 2: Per-newsletter summaries")
     per_item = []
     skipped_summarize = 0
-    for item in items:
+    with ThreadPoolExecutor(max_workers=SUBSTACK_SUMMARIZE_CONCURRENCY) as executor:
+        futures = [executor.submit(summarize_one, item) for item in items]
+    for item, future in zip(items, futures):
         try:
-            per_item.append(summarize_one(item))
+            per_item.append(future.result())
         except Exception as e:
             logger.warning(
                 "Skipping newsletter %s due to summarize failure: %s",
@@ -264,7 +289,7 @@ def _run_substack_pm(dry_run: bool = False) -> dict:
 
     # ── Stage 6: TTS ──────────────────────────────────
     logger.info("Stage 6: Synthesizing audio via Google TTS")
-    segment_paths = synthesize_script(segments)
+    segment_paths = _synthesize_overlapping_silence(segments)
 
     # ── Stage 7: Stitch ───────────────────────────────
     logger.info("Stage 7: Stitching audio")
@@ -337,4 +362,4 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     result = run_pipeline(source=args.source, dry_run=args.dry_run)
-    print(json.dumps(result, indent=2, default=str))
+    print(orjson.dumps(result, default=str, option=orjson.OPT_INDENT_2).decode())
@@ -1,7 +1,11 @@
+import copy
 import logging
+import mmap
+import re
 import shutil
 from datetime import datetime, timezone
 from email.utils import formatdate
+from functools import lru_cache
 from pathlib import Path
 
 from lxml import etree
@@ -29,6 +33,9 @@ NSMAP = {
 }
 TEMPLATE_PATH = ROOT_DIR / "templates" / "feed_template.xml"
 
+# First <item> of the channel, or its closing tag when there are no episodes yet.
+_INSERT_POINT_RE = re.compile(rb"<item[\s>]|</channel>")
+
 
 def get_episode_metadata(
     mp3_path: Path,
@@ -104,8 +111,13 @@ def update_feed(
     new_item: etree._Element,
     channel_config: dict | None = None,
 ) -> None:
-    """Parse existing feed.xml, insert new <item> as the first child of <channel>
-    (after the channel metadata elements), and write back.
+    """Insert new <item> as the first child of <channel> (after the channel
+    metadata elements) in feed.xml.
+
+    The serialized item is spliced into the file in place, so historical
+    items are never re-serialized; the full document is only parsed when
+    channel metadata needs syncing or the splice fails. Existing whitespace
+    is kept as-is rather than re-indenting the whole feed on every publish.
 
     channel_config: optional dict of overrides used when bootstrapping the
         template AND when syncing channel-level metadata. Defaults to AI
@@ -116,30 +128,14 @@ def update_feed(
     if not feed_path.exists():
         create_initial_feed(TEMPLATE_PATH, feed_path, config)
 
-    parser = etree.XMLParser(remove_blank_text=True)
-    tree = etree.parse(str(feed_path), parser)
-    root = tree.getroot()
-    channel = root.find("channel")
-
-    _sync_channel_metadata(channel, config)
-
-    # Find insertion point: after last non-item child of channel
-    insert_idx = 0
-    for i, child in enumerate(channel):
-        if child.tag == "item":
-            insert_idx = i
-            break
-    else:
-        insert_idx = len(channel)
-
-    channel.insert(insert_idx, new_item)
+    channel_head = _read_channel_head(feed_path)
+    if channel_head is not None:
+        if _sync_channel_metadata(channel_head, config):
+            _write_feed(feed_path, config)
+        if _splice_item(feed_path, new_item):
+            return
 
-    tree.write(
-        str(feed_path),
-        xml_declaration=True,
-        encoding="UTF-8",
-        pretty_print=True,
-    )
+    _write_feed(feed_path, config, new_item)
 
 
 def create_initial_feed(
@@ -148,14 +144,20 @@ def create_initial_feed(
     """Bootstrap a new feed.xml from the template, filling in config placeholders."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    content = template_path.read_text()
-    for key, value in config.items():
-        content = content.replace(f"{{{key}}}", value)
+    content = _read_template(template_path)
+    if config:
+        pattern = re.compile(r"\{(" + "|".join(re.escape(k) for k in config) + r")\}")
+        content = pattern.sub(lambda m: config[m.group(1)], content)
 
     output_path.write_text(content)
     logger.info("Created initial feed at %s", output_path)
 
 
+@lru_cache(maxsize=4)
+def _read_template(template_path: Path) -> str:
+    return template_path.read_text()
+
+
 def _default_channel_config(feed_path: Path) -> dict:
     feed_self_url = f"{PAGES_BASE_URL}/{feed_path.name}" if PAGES_BASE_URL else ""
     return {
@@ -168,11 +170,15 @@ def _default_channel_config(feed_path: Path) -> dict:
     }
 
 
-def _sync_channel_metadata(channel: etree._Element, config: dict) -> None:
-    """Update channel-level metadata fields to match current config values."""
+def _sync_channel_metadata(channel: etree._Element, config: dict) -> bool:
+    """Update channel-level metadata fields to match current config values.
+
+    Returns True if anything changed.
+    """
     itunes = f"{{{ITUNES_NS}}}"
     author = config.get("PODCAST_AUTHOR", PODCAST_AUTHOR)
     email = config.get("PODCAST_EMAIL", PODCAST_EMAIL)
+    changed = False
 
     field_map = {
         f"{itunes}author": author,
@@ -180,17 +186,105 @@ def _sync_channel_metadata(channel: etree._Element, config: dict) -> None:
     }
     for tag, value in field_map.items():
         el = channel.find(tag)
-        if el is not None:
-            el.text = value
-        else:
+        if el is None:
             el = etree.SubElement(channel, tag)
-            el.text = value
+        changed |= _set_text(el, value)
 
     owner = channel.find(f"{itunes}owner")
     if owner is not None:
         name_el = owner.find(f"{itunes}name")
         if name_el is not None:
-            name_el.text = author
+            changed |= _set_text(name_el, author)
         email_el = owner.find(f"{itunes}email")
         if email_el is not None:
-            email_el.text = email
+            changed |= _set_text(email_el, email)
+
+    return changed
+
+
+def _set_text(el: etree._Element, value: str) -> bool:
+    if (el.text or "") == value:
+        return False
+    el.text = value
+    return True
+
+
+def _read_channel_head(feed_path: Path) -> etree._Element | None:
+    """Parse <channel> only up to its first <item>.
+
+    Returns None if the feed is malformed or binds the itunes prefix to
+    something else (a spliced item would then be invalid).
+    """
+    try:
+        context = etree.iterparse(str(feed_path), events=("start",), tag="item")
+        channel = None
+        for _, item in context:
+            channel = item.getparent()
+            break
+        else:
+            channel = context.root.find("channel")
+    except etree.XMLSyntaxError:
+        return None
+    if channel is None or channel.nsmap.get("itunes") != ITUNES_NS:
+        return None
+    return channel
+
+
+def _write_feed(
+    feed_path: Path, config: dict, new_item: etree._Element | None = None
+) -> None:
+    """Full parse/write path: sync channel metadata and optionally insert
+    new_item before the first existing <item>."""
+    tree = etree.parse(str(feed_path))
+    channel = tree.getroot().find("channel")
+
+    _sync_channel_metadata(channel, config)
+
+    if new_item is not None:
+        first_item = channel.find("item")
+        if first_item is not None:
+            first_item.addprevious(new_item)
+        else:
+            channel.append(new_item)
+
+    tree.write(str(feed_path), xml_declaration=True, encoding="UTF-8")
+
+
+def _splice_item(feed_path: Path, new_item: etree._Element) -> bool:
+    """Write new_item's bytes directly before the first <item> (or before
+    </channel>). Returns False if the insertion point can't be found.
+
+    The spliced feed goes to a temp file that replaces feed.xml in one
+    rename, so a failed write never leaves the published feed truncated."""
+    tmp_path = feed_path.with_suffix(".tmp")
+    try:
+        with open(feed_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            match = _INSERT_POINT_RE.search(mm)
+            if match is None:
+                return False
+            offset = match.start()
+            line_start = mm.rfind(b"\n", 0, offset) + 1
+            if not mm[line_start:offset].strip():
+                offset = line_start
+            with open(tmp_path, "wb") as out:
+                out.write(mm[:offset])
+                out.write(_serialize_item(new_item, indented=offset == line_start))
+                out.write(mm[offset:])
+        tmp_path.replace(feed_path)
+    except (OSError, ValueError) as e:
+        logger.warning("In-place feed update failed, rewriting %s: %s", feed_path, e)
+        tmp_path.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def _serialize_item(item: etree._Element, indented: bool) -> bytes:
+    """Serialize item as it would appear under <channel> with the feed's
+    namespace prefixes, without per-item xmlns declarations."""
+    rss = etree.Element("rss", nsmap=NSMAP)
+    channel = etree.SubElement(rss, "channel")
+    channel.append(copy.deepcopy(item))
+    etree.indent(rss)
+    body = etree.tostring(rss, encoding="UTF-8", xml_declaration=False)
+    body = body[body.index(b"<channel>") + len(b"<channel>"):body.rindex(b"</channel>")]
+    return b"    " + body.strip() + b"\n" if indented else body.strip()
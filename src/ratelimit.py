@@ -0,0 +1,120 @@
+import logging
+import threading
+import time
+from collections.abc import Callable, Mapping
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+import requests
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+MAX_PAUSE_S = 60.0  # never stall ingest longer than this on one host's say-so
+RATE_LIMITED_STATUS_CODES = (429, 503)
+
+
+class HostLimiter:
+    """Per-host pause windows learned from rate-limit response headers.
+
+    After a response, update() records how long the host asked us to back
+    off (Retry-After on 429/503, or X-RateLimit-Remaining: 0 with
+    X-RateLimit-Reset). wait() blocks the calling thread until that host's
+    window has passed. Thread-safe; hosts never seen are never delayed.
+    """
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._clock = clock
+        self._sleep = sleep
+        self._resume_at: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def update(self, host: str, status_code: int, headers: Mapping[str, str]) -> None:
+        delay = _pause_seconds(status_code, headers)
+        if delay is None or delay <= 0:
+            return
+        delay = min(delay, MAX_PAUSE_S)
+        with self._lock:
+            resume_at = self._clock() + delay
+            if resume_at > self._resume_at.get(host, 0.0):
+                self._resume_at[host] = resume_at
+        logger.info("Rate limited by %s, pausing requests for %.1fs", host, delay)
+
+    def wait(self, host: str) -> None:
+        with self._lock:
+            remaining = self._resume_at.get(host, 0.0) - self._clock()
+        if remaining > 0:
+            self._sleep(remaining)
+
+
+class RateLimitedAdapter(requests.adapters.HTTPAdapter):
+    """HTTPAdapter that waits out a host's pause window before each request
+    and records rate-limit headers from each final response."""
+
+    def __init__(self, limiter: HostLimiter, **kwargs) -> None:
+        self.limiter = limiter
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        host = urlparse(request.url).hostname or ""
+        self.limiter.wait(host)
+        resp = super().send(request, **kwargs)
+        self.limiter.update(host, resp.status_code, resp.headers)
+        return resp
+
+
+class CappedRetry(Retry):
+    """urllib3 Retry whose Retry-After sleeps are capped at MAX_PAUSE_S.
+
+    urllib3 sleeps inside HTTPAdapter.send for whatever the server asks,
+    which would otherwise let one 429 stall an ingest worker indefinitely.
+    """
+
+    def get_retry_after(self, response) -> float | None:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_PAUSE_S)
+
+
+# ── Helpers ────────────────────────────────────────────
+
+
+def _pause_seconds(status_code: int, headers: Mapping[str, str]) -> float | None:
+    if status_code in RATE_LIMITED_STATUS_CODES:
+        retry_after = _parse_retry_after(headers.get("Retry-After"))
+        if retry_after is not None:
+            return retry_after
+
+    if headers.get("X-RateLimit-Remaining", "").strip() == "0":
+        return _parse_reset(headers.get("X-RateLimit-Reset"))
+    return None
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Retry-After is either delta-seconds or an HTTP-date."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(value).timestamp() - time.time()
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_reset(value: str | None) -> float | None:
+    """X-RateLimit-Reset is seconds-until-reset on some APIs and an epoch
+    timestamp on others (e.g. GitHub); values past 1e9 are treated as epoch."""
+    try:
+        reset = float(value)
+    except (TypeError, ValueError):
+        return None
+    return reset - time.time() if reset > 1e9 else reset
@@ -1,9 +1,9 @@
-import json
 import logging
 import re
-import time
+from functools import cache
 
 import anthropic
+import orjson
 
 from src.config import (
     ANTHROPIC_API_KEY,
@@ -15,18 +15,22 @@ from src.config import (
 
 logger = logging.getLogger(__name__)
 
-API_RETRY_DELAYS = [2, 8, 32]
-RETRYABLE_STATUS_CODES = (429, 500, 503)
+# The SDK retries 408/409/429/5xx and connection errors with exponential
+# backoff, honoring Retry-After when the API sends it.
+API_MAX_RETRIES = 4
 
-SCRIPT_PATTERN = re.compile(
-    r"\[(INTERVIEWER|EXPERT)\]:\s*(.+?)(?=\[(?:INTERVIEWER|EXPERT)\]:|$)",
-    re.DOTALL,
-)
+# Splitting on the tags alone is one linear scan; a lazy "text up to the next
+# tag" pattern re-tries the lookahead at every character of the script
+SPEAKER_TAG_PATTERN = re.compile(r"\[(INTERVIEWER|EXPERT)\]:")
 
 
 def build_script_prompt(themes: dict) -> str:
-    """Load prompts/scriptgen.txt and inject the themes JSON."""
-    return json.dumps(themes, indent=2, ensure_ascii=False)
+    """Load prompts/scriptgen.txt and inject the themes JSON.
+
+    Serialized compactly: indentation is billed as input tokens and the
+    model reads minified JSON just as well.
+    """
+    return orjson.dumps(themes).decode()
 
 
 def parse_script(raw_text: str) -> list[dict]:
@@ -36,11 +40,12 @@ def parse_script(raw_text: str) -> list[dict]:
     Returns list of ScriptSegment dicts.
     Raises ValueError if fewer than 4 segments parsed.
     """
-    matches = SCRIPT_PATTERN.findall(raw_text)
-
+    # split() alternates [preamble, tag, text, tag, text, ...]
+    parts = SPEAKER_TAG_PATTERN.split(raw_text)
     segments = [
-        {"speaker": speaker.lower(), "text": text.strip()}
-        for speaker, text in matches
+        {"speaker": speaker.lower(), "text": text}
+        for speaker, text in zip(parts[1::2], (part.strip() for part in parts[2::2]))
+        if text
     ]
 
     if len(segments) < 4:
@@ -56,13 +61,13 @@ def generate_script(themes: dict) -> list[dict]:
     """Call Claude API with the scriptgen prompt, then parse the result.
 
     On parse failure (ValueError from parse_script), retries once with
-    a correction message. Retry: 3 attempts with exponential backoff on
-    API errors. Hard fail (raise) if all retries exhausted.
+    a correction message. Transient API errors are retried by the SDK
+    client; hard fail (raise) once its retries are exhausted.
     """
     system_prompt = (PROMPTS_DIR / "scriptgen.txt").read_text()
     user_message = build_script_prompt(themes)
 
-    client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+    client = _get_client()
     messages = [{"role": "user", "content": user_message}]
 
     raw_text = _call_claude(client, system_prompt, messages)
@@ -96,15 +101,15 @@ def generate_substack_script(
     """Substack-flavored two-speaker script. Same retry pattern as
     generate_script. INTERVIEWER must speak first."""
     system_prompt = (PROMPTS_DIR / prompt_file).read_text()
-    user_message = json.dumps({
+    user_message = orjson.dumps({
         "week_ending": week_ending or "",
         "newsletter_count": len(per_item),
         "per_item_summaries": per_item,
         "aggregate": aggregate,
         "action_items": action_items,
-    }, ensure_ascii=False)
+    }).decode()
 
-    client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+    client = _get_client()
     messages = [{"role": "user", "content": user_message}]
 
     raw_text = _call_claude(client, system_prompt, messages)
@@ -125,30 +130,24 @@ def generate_substack_script(
     return segments
 
 
+@cache
+def _get_client() -> anthropic.Anthropic:
+    """Shared client, so the correction round trip reuses the same
+    connection pool. Built on first use rather than at import."""
+    return anthropic.Anthropic(api_key=ANTHROPIC_API_KEY, max_retries=API_MAX_RETRIES)
+
+
 def _call_claude(
     client: anthropic.Anthropic,
     system_prompt: str,
     messages: list[dict],
 ) -> str:
-    """Call Claude API with retries on transient HTTP errors."""
-    for attempt, delay in enumerate(API_RETRY_DELAYS):
-        try:
-            response = client.messages.create(
-                model=CLAUDE_MODEL,
-                max_tokens=SCRIPTGEN_MAX_TOKENS,
-                temperature=SCRIPTGEN_TEMPERATURE,
-                system=system_prompt,
-                messages=messages,
-            )
-            return response.content[0].text
-        except anthropic.APIStatusError as e:
-            if e.status_code in RETRYABLE_STATUS_CODES and attempt < len(API_RETRY_DELAYS) - 1:
-                logger.warning(
-                    "Claude API error %d (attempt %d/%d), retrying in %ds",
-                    e.status_code, attempt + 1, len(API_RETRY_DELAYS), delay,
-                )
-                time.sleep(delay)
-            else:
-                raise
-
-    raise RuntimeError("All Claude API retries exhausted")
+    """Call Claude API. Retries on transient errors happen inside the SDK."""
+    response = client.messages.create(
+        model=CLAUDE_MODEL,
+        max_tokens=SCRIPTGEN_MAX_TOKENS,
+        temperature=SCRIPTGEN_TEMPERATURE,
+        system=system_prompt,
+        messages=messages,
+    )
+    return response.content[0].text
@@ -1,14 +1,22 @@
-import json
+import hashlib
 import logging
+import re
 import time
+from collections.abc import Iterator
+from functools import cache, lru_cache
+from pathlib import Path
 from typing import TypedDict
 
 import anthropic
+import orjson
 
 from src.config import (
     ANTHROPIC_API_KEY,
     CLAUDE_MODEL,
     PROMPTS_DIR,
+    SUMMARIZE_CACHE_DIR,
+    SUMMARIZE_CACHE_ENABLED,
+    SUMMARIZE_CACHE_TTL_S,
     SUMMARIZE_MAX_TOKENS,
     SUMMARIZE_TEMPERATURE,
 )
@@ -35,6 +43,11 @@ logger = logging.getLogger(__name__)
 API_RETRY_DELAYS = [2, 8, 32]  # exponential backoff seconds
 RETRYABLE_STATUS_CODES = (429, 500, 503)
 
+_FENCE_RE = re.compile(r"```(?:json)?\s*\n(.*?)```", re.DOTALL)
+# Scraped and undated items are stamped with the fetch time, so these lines
+# change on every pipeline run even when the content doesn't
+_PUBLISHED_LINE_RE = re.compile(r"^  Published: .*\n", re.MULTILINE)
+
 
 MAX_ITEMS_PER_PROVIDER = 150
 MAX_PROMPT_CHARS = 400_000  # ~100K tokens, safely under 200K limit
@@ -48,6 +61,19 @@ def build_summarize_prompt(content: dict) -> str:
     prompt length to stay within API token limits.
     """
     lines = []
+    total = -1  # chars so far, counting the newline before every line but the first
+    for line in _summarize_prompt_lines(content):
+        lines.append(line)
+        total += len(line) + 1
+        if total > MAX_PROMPT_CHARS:
+            # Stop at the first line past the cap rather than serializing
+            # every remaining item just to slice it off
+            logger.warning("Prompt exceeds %d chars, truncating", MAX_PROMPT_CHARS)
+            return "\n".join(lines)[:MAX_PROMPT_CHARS] + "\n\n[TRUNCATED — content exceeded limit]"
+    return "\n".join(lines)
+
+
+def _summarize_prompt_lines(content: dict) -> Iterator[str]:
     for provider in ("anthropic", "openai", "gemini"):
         items = content.get(provider, [])
         if not items:
@@ -58,27 +84,18 @@ def build_summarize_prompt(content: dict) -> str:
                 provider, len(items), MAX_ITEMS_PER_PROVIDER,
             )
             items = items[:MAX_ITEMS_PER_PROVIDER]
-        lines.append(f"## {provider.upper()} ({len(items)} items)")
+        yield f"## {provider.upper()} ({len(items)} items)"
         for item in items:
-            lines.append(f"- **{item.get('title', 'Untitled')}**")
-            lines.append(f"  URL: {item.get('url', '')}")
-            lines.append(f"  Published: {item.get('published', '')}")
-            lines.append(f"  Summary: {item.get('summary', '')}")
-        lines.append("")
+            yield f"- **{item.get('title', 'Untitled')}**"
+            yield f"  URL: {item.get('url', '')}"
+            yield f"  Published: {item.get('published', '')}"
+            yield f"  Summary: {item.get('summary', '')}"
+        yield ""
 
     if content.get("errors"):
-        lines.append(f"## ERRORS ({len(content['errors'])} sources failed)")
+        yield f"## ERRORS ({len(content['errors'])} sources failed)"
         for err in content["errors"]:
-            lines.append(f"- {err['source']}: {err['error']}")
-
-    result = "\n".join(lines)
-    if len(result) > MAX_PROMPT_CHARS:
-        logger.warning(
-            "Prompt too long (%d chars), truncating to %d",
-            len(result), MAX_PROMPT_CHARS,
-        )
-        result = result[:MAX_PROMPT_CHARS] + "\n\n[TRUNCATED — content exceeded limit]"
-    return result
+            yield f"- {err['source']}: {err['error']}"
 
 
 def summarize(content: dict) -> dict:
@@ -90,18 +107,40 @@ def summarize(content: dict) -> dict:
 
     Retry: 3 attempts with exponential backoff (2s, 8s, 32s) on API errors.
     Hard fail (raise) if all retries exhausted.
+
+    Valid results are cached under SUMMARIZE_CACHE_DIR for
+    SUMMARIZE_CACHE_TTL_S, keyed on the prompt and model settings, so
+    re-running on the same content skips Claude, including a full pipeline
+    re-run that re-stamps scraped items. SUMMARIZE_CACHE=0 bypasses.
     """
-    system_prompt = (PROMPTS_DIR / "summarize.txt").read_text()
+    system_prompt = _load_prompt("summarize.txt")
     user_message = build_summarize_prompt(content)
 
-    client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
-    messages = [{"role": "user", "content": user_message}]
+    cache_path = _summary_cache_path(system_prompt, user_message) if SUMMARIZE_CACHE_ENABLED else None
+    if cache_path is not None:
+        cached = _load_cached_summary(cache_path)
+        if cached is not None:
+            logger.info("Summarize cache hit: %s", cache_path)
+            return cached
+
+    client = _get_client()
+    # The bulk content is a second cache breakpoint: the correction retry
+    # re-sends it unchanged, so only the short correction turns are new
+    messages = [{
+        "role": "user",
+        "content": [{
+            "type": "text",
+            "text": user_message,
+            "cache_control": {"type": "ephemeral"},
+        }],
+    }]
 
     raw_text = _call_claude(client, system_prompt, messages)
 
     # Try to parse as JSON
     result = _try_parse_json(raw_text)
     if result is not None and _validate_summarize_output(result):
+        _store_summary(cache_path, result)
         return result
 
     # Retry once with correction
@@ -115,11 +154,24 @@ def summarize(content: dict) -> dict:
     raw_text = _call_claude(client, system_prompt, messages)
     result = _try_parse_json(raw_text)
     if result is not None and _validate_summarize_output(result):
+        _store_summary(cache_path, result)
         return result
 
     raise ValueError(f"Summarize failed to produce valid JSON after retry. Last response: {raw_text[:200]}")
 
 
+@cache
+def _get_client() -> anthropic.Anthropic:
+    """Shared client, so retries and the per-newsletter calls reuse the
+    SDK's pooled keep-alive connections. Built on first use."""
+    return anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+
+
+@lru_cache(maxsize=8)
+def _load_prompt(name: str) -> str:
+    return (PROMPTS_DIR / name).read_text()
+
+
 def _call_claude(
     client: anthropic.Anthropic,
     system_prompt: str,
@@ -132,7 +184,13 @@ def _call_claude(
                 model=CLAUDE_MODEL,
                 max_tokens=SUMMARIZE_MAX_TOKENS,
                 temperature=SUMMARIZE_TEMPERATURE,
-                system=system_prompt,
+                # Static instructions as a cached prefix; correction turns on
+                # retry come after it, so the prefix still matches
+                system=[{
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }],
                 messages=messages,
             )
             if response.stop_reason == "max_tokens":
@@ -154,23 +212,68 @@ def _call_claude(
     raise RuntimeError("All Claude API retries exhausted")
 
 
+def _summary_cache_path(system_prompt: str, user_message: str) -> Path:
+    """Cache file for a summarize request: everything sent to Claude that
+    determines the result, except the per-item Published lines. Those carry
+    per-run timestamps, and within SUMMARIZE_CACHE_TTL_S a real date can't
+    move far enough to change the summary."""
+    key = orjson.dumps(
+        {
+            "model": CLAUDE_MODEL,
+            "max_tokens": SUMMARIZE_MAX_TOKENS,
+            "temperature": SUMMARIZE_TEMPERATURE,
+            "system": system_prompt,
+            "user": _PUBLISHED_LINE_RE.sub("", user_message),
+        },
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return SUMMARIZE_CACHE_DIR / f"{hashlib.sha256(key).hexdigest()[:16]}.json"
+
+
+def _load_cached_summary(path: Path) -> dict | None:
+    try:
+        if time.time() - path.stat().st_mtime > SUMMARIZE_CACHE_TTL_S:
+            return None
+        return orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def _store_summary(path: Path | None, result: dict) -> None:
+    """Write via a temp file + rename, so a reader never sees a partial entry."""
+    if path is None:
+        return
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(orjson.dumps(result))
+        tmp_path.replace(path)
+    except OSError as e:
+        logger.warning("Failed to cache summary in %s: %s", path, e)
+
+
 def _try_parse_json(text: str) -> dict | None:
     """Attempt to parse text as JSON, stripping markdown fences if present."""
     text = text.strip()
 
     # 1. Try raw parse first
     try:
-        return json.loads(text)
-    except json.JSONDecodeError:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
         pass
 
-    # 2. Extract content between ```json ... ``` fences
-    import re
-    fence_match = re.search(r"```(?:json)?\s*\n(.*?)```", text, re.DOTALL)
+    # 2. Extract content between ```json ... ``` fences — usually the whole
+    # reply, which needs no regex
+    if text.startswith("```json") and text.endswith("```"):
+        try:
+            return orjson.loads(text.removeprefix("```json").removesuffix("```"))
+        except orjson.JSONDecodeError:
+            pass
+    fence_match = _FENCE_RE.search(text)
     if fence_match:
         try:
-            return json.loads(fence_match.group(1).strip())
-        except json.JSONDecodeError:
+            return orjson.loads(fence_match.group(1).strip())
+        except orjson.JSONDecodeError:
             pass
 
     # 3. Find the outermost { ... } and try parsing that
@@ -178,8 +281,8 @@ def _try_parse_json(text: str) -> dict | None:
     end = text.rfind("}")
     if start != -1 and end > start:
         try:
-            return json.loads(text[start:end + 1])
-        except json.JSONDecodeError:
+            return orjson.loads(text[start:end + 1])
+        except orjson.JSONDecodeError:
             pass
 
     return None
@@ -207,16 +310,16 @@ def summarize_one(item: ContentItem, prompt_file: str = "summarize_substack.txt"
     """
     item_label = item.get("url") or item.get("title") or item.get("id") or "<unknown>"
 
-    system_prompt = (PROMPTS_DIR / prompt_file).read_text()
-    user_message = json.dumps({
+    system_prompt = _load_prompt(prompt_file)
+    user_message = orjson.dumps({
         "title": item.get("title", ""),
         "publication": item.get("source_meta", {}).get("publication", ""),
         "author": item.get("author"),
         "url": item.get("url", ""),
         "body_text": item.get("body_text", ""),
-    }, ensure_ascii=False)
+    }).decode()
 
-    client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+    client = _get_client()
     messages = [{"role": "user", "content": user_message}]
 
     raw = _call_claude(client, system_prompt, messages)
@@ -269,13 +372,13 @@ def aggregate_summarize(
     week_ending: str | None = None,
 ) -> AggregateSummary:
     """Cross-cutting wrap-up across the week's newsletter summaries."""
-    system_prompt = (PROMPTS_DIR / prompt_file).read_text()
-    user_message = json.dumps({
+    system_prompt = _load_prompt(prompt_file)
+    user_message = orjson.dumps({
         "week_ending": week_ending or "",
         "newsletter_summaries": per_item,
-    }, ensure_ascii=False)
+    }).decode()
 
-    client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+    client = _get_client()
     messages = [{"role": "user", "content": user_message}]
 
     raw = _call_claude(client, system_prompt, messages)
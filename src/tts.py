@@ -1,20 +1,38 @@
+import hashlib
 import logging
+import re
+import shutil
 import tempfile
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cache
 from pathlib import Path
 
+import orjson
 from google.cloud import texttospeech
 
+from src.audio import concat_mp3
 from src.config import (
     EXPERT_VOICE,
     INTERVIEWER_VOICE,
     TTS_CHUNK_BYTE_LIMIT,
+    TTS_CONCURRENCY,
+    TTS_SAMPLE_RATE_HZ,
 )
 
 logger = logging.getLogger(__name__)
 
 TTS_RETRY_DELAYS = [2, 8, 32]
 
+_SENTENCE_SPLIT_RE = re.compile("(" + "|".join(map(re.escape, (". ", "! ", "? "))) + ")")
+_CLAUSE_SPLIT_RE = re.compile("(" + "|".join(map(re.escape, (", ", "; ", " — "))) + ")")
+
+_AUDIO_CONFIG = texttospeech.AudioConfig(
+    audio_encoding=texttospeech.AudioEncoding.MP3,
+    sample_rate_hertz=TTS_SAMPLE_RATE_HZ,
+)
+
 
 def text_to_chunks(text: str, byte_limit: int = TTS_CHUNK_BYTE_LIMIT) -> list[str]:
     """Split text into chunks that fit within the byte limit.
@@ -24,31 +42,35 @@ def text_to_chunks(text: str, byte_limit: int = TTS_CHUNK_BYTE_LIMIT) -> list[st
     2. If a single sentence exceeds the limit, split on clause boundaries (", ", "; ", " — ").
     3. If a clause still exceeds, split on word boundaries.
 
-    Byte length is checked with len(chunk.encode('utf-8')), NOT len(chunk).
+    Byte length is checked with len(chunk.encode('utf-8')), NOT len(chunk);
+    each piece is encoded once and chunk sizes are tracked as running totals.
     """
     if len(text.encode("utf-8")) <= byte_limit:
         return [text]
 
     # Split into sentences
-    sentences = _split_keeping_delimiters(text, [". ", "! ", "? "])
+    sentences = _split_keeping_delimiters(text, _SENTENCE_SPLIT_RE)
     chunks = []
     current = ""
+    current_bytes = 0
 
     for sentence in sentences:
-        candidate = current + sentence if current else sentence
-        if len(candidate.encode("utf-8")) <= byte_limit:
-            current = candidate
+        sentence_bytes = len(sentence.encode("utf-8"))
+        if current_bytes + sentence_bytes <= byte_limit:
+            current += sentence
+            current_bytes += sentence_bytes
         else:
             if current:
                 chunks.append(current)
             # Check if this single sentence fits
-            if len(sentence.encode("utf-8")) <= byte_limit:
-                current = sentence
+            if sentence_bytes <= byte_limit:
+                current, current_bytes = sentence, sentence_bytes
             else:
                 # Sentence too long — split on clause boundaries
                 clause_chunks = _split_large_text(sentence, byte_limit)
                 chunks.extend(clause_chunks[:-1])
                 current = clause_chunks[-1]
+                current_bytes = len(current.encode("utf-8"))
 
     if current:
         chunks.append(current)
@@ -62,24 +84,17 @@ def synthesize_segment(text: str, voice_config: dict) -> bytes:
     Returns raw MP3 bytes.
     Retry: 3 attempts with exponential backoff on API errors.
     """
-    client = texttospeech.TextToSpeechClient()
+    client = _tts_client()
 
     synthesis_input = texttospeech.SynthesisInput(text=text)
-    voice = texttospeech.VoiceSelectionParams(
-        language_code=voice_config["language_code"],
-        name=voice_config["name"],
-        ssml_gender=getattr(
-            texttospeech.SsmlVoiceGender, voice_config["ssml_gender"]
-        ),
-    )
-    audio_config = texttospeech.AudioConfig(
-        audio_encoding=texttospeech.AudioEncoding.MP3
+    voice = _voice_params(
+        voice_config["language_code"], voice_config["name"], voice_config["ssml_gender"]
     )
 
     for attempt, delay in enumerate(TTS_RETRY_DELAYS):
         try:
             response = client.synthesize_speech(
-                input=synthesis_input, voice=voice, audio_config=audio_config
+                input=synthesis_input, voice=voice, audio_config=_AUDIO_CONFIG
             )
             return response.audio_content
         except Exception as e:
@@ -95,54 +110,72 @@ def synthesize_segment(text: str, voice_config: dict) -> bytes:
     raise RuntimeError("All TTS retries exhausted")
 
 
-def synthesize_script(segments: list[dict]) -> list[Path]:
+def synthesize_script(segments: list[dict], cache_dir: Path | None = None) -> list[Path]:
     """Process all script segments through TTS.
 
     For each segment:
     1. Select voice config based on segment["speaker"]
     2. Chunk the text with text_to_chunks()
     3. Synthesize each chunk with synthesize_segment()
-    4. Concatenate chunk bytes and write to a temp .mp3 file
+    4. Write the segment's temp .mp3 file; a multi-chunk segment is joined
+       with audio.concat_mp3, so the file is one properly framed stream
+
+    Chunks from all segments are synthesized TTS_CONCURRENCY at a time (the
+    calls are network-bound), so one long segment doesn't serialize its
+    chunks; returned paths keep script order. Repeated chunks with the same
+    voice are synthesized once.
+
+    With cache_dir set, a script identical to a previous run (same segments,
+    voices and sample rate) reuses that run's segment files instead of
+    calling TTS. Runs with failed chunks are not cached as a whole, but every
+    successful chunk is, so recurring intros and outros in a new script are
+    read from cache_dir/chunks rather than synthesized again.
 
     If a single chunk fails after retries, substitute silence.
     If >30% of total chunks fail, raise RuntimeError (abort episode).
     """
+    cached_dir = cache_dir / _script_hash(segments) if cache_dir is not None else None
+    if cached_dir is not None and cached_dir.is_dir():
+        logger.info("TTS cache hit: %s", cached_dir)
+        return [cached_dir / _segment_filename(i) for i in range(len(segments))]
+
+    chunk_cache_dir = cache_dir / "chunks" if cache_dir is not None else None
     tmp_dir = Path(tempfile.mkdtemp(prefix="tts_"))
-    segment_paths = []
 
     total_chunks = 0
     failed_chunks = 0
-
-    for i, segment in enumerate(segments):
-        voice_config = (
-            INTERVIEWER_VOICE
-            if segment["speaker"] == "interviewer"
-            else EXPERT_VOICE
-        )
-
-        chunks = text_to_chunks(segment["text"])
-        total_chunks += len(chunks)
-        audio_parts = []
-
-        for chunk in chunks:
-            try:
-                audio_bytes = synthesize_segment(chunk, voice_config)
-                audio_parts.append(audio_bytes)
-            except Exception as e:
-                logger.warning(
-                    "Chunk failed for segment %d, substituting silence: %s", i, e
-                )
-                failed_chunks += 1
-                # Substitute ~1 second of silence (empty bytes — will be
-                # handled by audio.generate_silence in the stitching phase)
-                audio_parts.append(b"")
-
-        # Write concatenated audio to temp file
-        segment_path = tmp_dir / f"segment_{i:03d}.mp3"
-        with open(segment_path, "wb") as f:
-            for part in audio_parts:
-                f.write(part)
-        segment_paths.append(segment_path)
+    segment_paths = []
+    with ThreadPoolExecutor(max_workers=TTS_CONCURRENCY) as executor:
+        # Identical (text, voice) chunks — repeated stock phrases — are
+        # synthesized once and share the result
+        in_flight: dict[tuple[str, str], Future] = {}
+        chunk_futures = []
+        for i, segment in enumerate(segments):
+            voice_config = _voice_for(segment)
+            futures = []
+            for chunk in text_to_chunks(segment["text"]):
+                key = (chunk, voice_config["name"])
+                if key not in in_flight:
+                    in_flight[key] = executor.submit(
+                        _synthesize_chunk, i, chunk, voice_config, chunk_cache_dir
+                    )
+                futures.append(in_flight[key])
+            chunk_futures.append(futures)
+
+        duplicates = sum(map(len, chunk_futures)) - len(in_flight)
+        if duplicates:
+            logger.info("TTS: reusing audio for %d duplicate chunks", duplicates)
+
+        for i, futures in enumerate(chunk_futures):
+            parts = [future.result() for future in futures]
+            total_chunks += len(parts)
+            failed_chunks += parts.count(None)
+
+            # A failed chunk simply drops out (audio.stitch_audio still pads
+            # the speaker turn)
+            segment_path = tmp_dir / _segment_filename(i)
+            _write_segment(segment_path, [part for part in parts if part is not None])
+            segment_paths.append(segment_path)
 
     # Check abort threshold after processing all segments
     if total_chunks > 0 and (failed_chunks / total_chunks) > 0.3:
@@ -150,52 +183,189 @@ def synthesize_script(segments: list[dict]) -> list[Path]:
             f"TTS abort: {failed_chunks}/{total_chunks} chunks failed (>30%)"
         )
 
+    if cached_dir is not None and failed_chunks == 0:
+        _store_in_cache(tmp_dir, cached_dir)
+
     return segment_paths
 
 
+def _synthesize_chunk(
+    i: int, chunk: str, voice_config: dict, chunk_cache_dir: Path | None = None
+) -> bytes | None:
+    """Synthesize one chunk of segment i, via chunk_cache_dir when set.
+    Returns None if it failed after retries, so the caller can substitute
+    silence."""
+    cache_path = (
+        _chunk_cache_path(chunk_cache_dir, chunk, voice_config)
+        if chunk_cache_dir is not None
+        else None
+    )
+    if cache_path is not None:
+        try:
+            return cache_path.read_bytes()
+        except OSError:
+            pass
+
+    try:
+        audio = synthesize_segment(chunk, voice_config)
+    except Exception as e:
+        logger.warning(
+            "Chunk failed for segment %d, substituting silence: %s", i, e
+        )
+        return None
+
+    if cache_path is not None:
+        _store_chunk(cache_path, audio)
+    return audio
+
+
 # ── Helpers ────────────────────────────────────────────
 
 
-def _split_keeping_delimiters(text: str, delimiters: list[str]) -> list[str]:
-    """Split text on delimiters, keeping the delimiter attached to the preceding part."""
-    parts = [text]
-    for delim in delimiters:
-        new_parts = []
-        for part in parts:
-            splits = part.split(delim)
-            for j, s in enumerate(splits):
-                if j < len(splits) - 1:
-                    new_parts.append(s + delim)
-                else:
-                    if s:
-                        new_parts.append(s)
-        parts = new_parts
-    return parts
+def _write_segment(segment_path: Path, parts: list[bytes]) -> None:
+    """Write a segment's chunk audio. One chunk is written as returned by TTS;
+    several are written as chunk files and joined frame-aware by ffmpeg,
+    rather than appending the MP3 bitstreams byte for byte."""
+    if len(parts) <= 1:
+        segment_path.write_bytes(parts[0] if parts else b"")
+        return
+
+    with tempfile.TemporaryDirectory(prefix="chunks_") as work_dir:
+        chunk_paths = []
+        for j, part in enumerate(parts):
+            chunk_path = Path(work_dir) / f"chunk_{j:03d}.mp3"
+            chunk_path.write_bytes(part)
+            chunk_paths.append(chunk_path)
+        concat_mp3(chunk_paths, segment_path, Path(work_dir))
+
+
+def _voice_for(segment: dict) -> dict:
+    return (
+        INTERVIEWER_VOICE
+        if segment["speaker"] == "interviewer"
+        else EXPERT_VOICE
+    )
+
+
+_tts_client_lock = threading.Lock()
+
+
+def _tts_client() -> texttospeech.TextToSpeechClient:
+    """One client (one gRPC channel, one credential lookup) for the process.
+    The client is thread-safe, so the synthesis workers share it. The first
+    calls come from several workers at once, and functools.cache doesn't
+    lock, so construction is serialized here."""
+    with _tts_client_lock:
+        return _new_tts_client()
+
+
+@cache
+def _new_tts_client() -> texttospeech.TextToSpeechClient:
+    return texttospeech.TextToSpeechClient()
+
+
+@cache
+def _voice_params(
+    language_code: str, name: str, ssml_gender: str
+) -> texttospeech.VoiceSelectionParams:
+    """One VoiceSelectionParams per voice, built on first use rather than per chunk."""
+    return texttospeech.VoiceSelectionParams(
+        language_code=language_code,
+        name=name,
+        ssml_gender=getattr(texttospeech.SsmlVoiceGender, ssml_gender),
+    )
+
+
+def _segment_filename(i: int) -> str:
+    return f"segment_{i:03d}.mp3"
+
+
+def _script_hash(segments: list[dict]) -> str:
+    """Key for the TTS cache: everything that determines the synthesized audio."""
+    key = orjson.dumps(
+        {
+            "segments": segments,
+            "voices": [INTERVIEWER_VOICE, EXPERT_VOICE],
+            "sample_rate_hz": TTS_SAMPLE_RATE_HZ,
+        },
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return hashlib.sha256(key).hexdigest()[:16]
+
+
+def _chunk_cache_path(chunk_cache_dir: Path, chunk: str, voice_config: dict) -> Path:
+    """Cache file for one chunk, keyed on everything sent to TTS — a voice or
+    sample-rate change misses instead of serving stale audio."""
+    key = orjson.dumps(
+        {
+            "text": chunk,
+            "voice": voice_config,
+            "sample_rate_hz": TTS_SAMPLE_RATE_HZ,
+        },
+        option=orjson.OPT_SORT_KEYS,
+    )
+    digest = hashlib.sha256(key).hexdigest()
+    return chunk_cache_dir / digest[:2] / f"{digest[2:]}.mp3"
+
+
+def _store_chunk(path: Path, audio: bytes) -> None:
+    """Write via a temp file + rename, so a reader never sees a partial chunk."""
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(audio)
+        tmp_path.replace(path)
+    except OSError as e:
+        logger.warning("Failed to cache TTS chunk in %s: %s", path, e)
+
+
+def _store_in_cache(tmp_dir: Path, cached_dir: Path) -> None:
+    """Copy a finished TTS run into the cache, publishing it with one rename."""
+    cached_dir.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f"{cached_dir.name}_", dir=cached_dir.parent))
+    try:
+        shutil.copytree(tmp_dir, staging, dirs_exist_ok=True)
+        staging.rename(cached_dir)
+    except OSError as e:
+        logger.warning("Failed to cache TTS output in %s: %s", cached_dir, e)
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def _split_keeping_delimiters(text: str, pattern: re.Pattern) -> list[str]:
+    """Split text on a _*_SPLIT_RE pattern in one pass, keeping each delimiter
+    attached to the preceding part."""
+    parts = pattern.split(text)
+    pieces = [part + delim for part, delim in zip(parts[0::2], parts[1::2])]
+    if parts[-1]:
+        pieces.append(parts[-1])
+    return pieces
 
 
 def _split_large_text(text: str, byte_limit: int) -> list[str]:
     """Split a single too-large text on clause then word boundaries."""
     # Try clause boundaries first
-    clause_delimiters = [", ", "; ", " — "]
-    clauses = _split_keeping_delimiters(text, clause_delimiters)
+    clauses = _split_keeping_delimiters(text, _CLAUSE_SPLIT_RE)
 
     chunks = []
     current = ""
+    current_bytes = 0
 
     for clause in clauses:
-        candidate = current + clause if current else clause
-        if len(candidate.encode("utf-8")) <= byte_limit:
-            current = candidate
+        clause_bytes = len(clause.encode("utf-8"))
+        if current_bytes + clause_bytes <= byte_limit:
+            current += clause
+            current_bytes += clause_bytes
         else:
             if current:
                 chunks.append(current)
-            if len(clause.encode("utf-8")) <= byte_limit:
-                current = clause
+            if clause_bytes <= byte_limit:
+                current, current_bytes = clause, clause_bytes
             else:
                 # Clause still too long — split on words
                 word_chunks = _split_on_words(clause, byte_limit)
                 chunks.extend(word_chunks[:-1])
                 current = word_chunks[-1]
+                current_bytes = len(current.encode("utf-8"))
 
     if current:
         chunks.append(current)
@@ -204,21 +374,26 @@ def _split_large_text(text: str, byte_limit: int) -> list[str]:
 
 
 def _split_on_words(text: str, byte_limit: int) -> list[str]:
-    """Last resort: split on word boundaries."""
+    """Last resort: split on word boundaries.
+
+    Tracks the running byte size of words[start:i] and joins each chunk's
+    words once, when the chunk is emitted.
+    """
     words = text.split(" ")
     chunks = []
-    current = ""
-
-    for word in words:
-        candidate = current + " " + word if current else word
-        if len(candidate.encode("utf-8")) <= byte_limit:
-            current = candidate
+    start = 0
+    current_bytes = 0
+
+    for i, word in enumerate(words):
+        word_bytes = len(word.encode("utf-8"))
+        if i == start:
+            current_bytes = word_bytes
+        # +1 for the joining space
+        elif current_bytes + 1 + word_bytes <= byte_limit:
+            current_bytes += 1 + word_bytes
         else:
-            if current:
-                chunks.append(current)
-            current = word
-
-    if current:
-        chunks.append(current)
+            chunks.append(" ".join(words[start:i]))
+            start, current_bytes = i, word_bytes
 
+    chunks.append(" ".join(words[start:]))
     return chunks
@@ -0,0 +1,54 @@
+from collections import namedtuple
+from functools import cache
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import anthropic
+import pytest
+
+from src import scriptgen, summarize, tts
+
+_Block = namedtuple("_Block", "text")
+_Response = namedtuple("_Response", "content stop_reason", defaults=("end_turn",))
+
+
+@pytest.fixture(autouse=True)
+def _fresh_clients():
+    """Every test builds its API clients afresh, so patched client classes apply."""
+    scriptgen._get_client.cache_clear()
+    summarize._get_client.cache_clear()
+    tts._new_tts_client.cache_clear()
+    yield
+    scriptgen._get_client.cache_clear()
+    summarize._get_client.cache_clear()
+    tts._new_tts_client.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def no_sleep():
+    """Retry backoff never really sleeps; tests that count sleeps take this fixture."""
+    with patch("src.summarize.time.sleep") as mock_sleep, \
+            patch("src.tts.time.sleep", mock_sleep):
+        yield mock_sleep
+
+
+@pytest.fixture(scope="session")
+def mock_response():
+    """Factory for stand-in Claude API responses with the given text."""
+    def _factory(text):
+        return _Response(content=[_Block(text=text)])
+    return _factory
+
+
+@pytest.fixture(scope="session")
+def api_error():
+    """Factory for anthropic.APIStatusError by status code, built once per
+    status over a plain stand-in response."""
+    @cache
+    def _factory(status_code):
+        return anthropic.APIStatusError(
+            message=f"status {status_code}",
+            response=SimpleNamespace(status_code=status_code, headers={}, request=None),
+            body={"error": {"message": f"status {status_code}"}},
+        )
+    return _factory
@@ -1,14 +1,25 @@
 from pathlib import Path
-from unittest.mock import patch, MagicMock, call
+from unittest.mock import patch, MagicMock
 
 import pytest
 
 from src.audio import (
+    _silence_cache,
     generate_silence,
+    warm_silence_cache,
     stitch_audio,
     get_mp3_duration_seconds,
     format_duration_itunes,
 )
+from src.config import MP3_BITRATE
+
+
+@pytest.fixture(autouse=True)
+def _clear_silence_cache(tmp_path):
+    _silence_cache.clear()
+    with patch("src.audio.SILENCE_CACHE_DIR", tmp_path / "silence"):
+        yield
+    _silence_cache.clear()
 
 
 # ── generate_silence ──────────────────────────────────
@@ -31,6 +42,18 @@ class TestGenerateSilence:
         assert "0.4" in cmd  # 400ms = 0.4s
         assert "libmp3lame" in cmd
 
+    @patch("src.audio.subprocess.run")
+    def test_matches_tts_codec_params(self, mock_run):
+        """Silence is 24kHz mono at the TTS bitrate so it can be stream-copied."""
+        mock_run.return_value = MagicMock(returncode=0)
+
+        generate_silence(400, Path("/tmp/silence.mp3"))
+
+        cmd = mock_run.call_args[0][0]
+        assert cmd[cmd.index("-ar") + 1] == "24000"
+        assert cmd[cmd.index("-ac") + 1] == "1"
+        assert cmd[cmd.index("-b:a") + 1] == f"{MP3_BITRATE // 1000}k"
+
     @patch("src.audio.subprocess.run")
     def test_duration_conversion(self, mock_run):
         """Duration in ms is correctly converted to seconds."""
@@ -41,6 +64,50 @@ class TestGenerateSilence:
         cmd = mock_run.call_args[0][0]
         assert "1.5" in cmd
 
+    @patch("src.audio.subprocess.run")
+    def test_reuses_encoded_silence(self, mock_run, tmp_path):
+        """A second request for the same duration writes cached bytes without ffmpeg."""
+        def fake_ffmpeg(cmd, **kwargs):
+            Path(cmd[-1]).write_bytes(b"ID3silence")
+            return MagicMock(returncode=0)
+        mock_run.side_effect = fake_ffmpeg
+
+        generate_silence(400, tmp_path / "first.mp3")
+        second = generate_silence(400, tmp_path / "second.mp3")
+
+        mock_run.assert_called_once()
+        assert second.read_bytes() == b"ID3silence"
+
+    @patch("src.audio.subprocess.run")
+    def test_reuses_silence_from_disk_across_runs(self, mock_run, tmp_path):
+        """Silence encoded by an earlier process is read from disk, not re-encoded."""
+        def fake_ffmpeg(cmd, **kwargs):
+            Path(cmd[-1]).write_bytes(b"ID3silence")
+            return MagicMock(returncode=0)
+        mock_run.side_effect = fake_ffmpeg
+
+        generate_silence(400, tmp_path / "first.mp3")
+        _silence_cache.clear()  # a fresh process
+        second = generate_silence(400, tmp_path / "second.mp3")
+        generate_silence(800, tmp_path / "longer.mp3")
+
+        assert mock_run.call_count == 2  # 400ms once, 800ms once
+        assert second.read_bytes() == b"ID3silence"
+
+    @patch("src.audio.subprocess.run")
+    def test_warm_up_fills_cache_once(self, mock_run):
+        """warm_silence_cache encodes once; later warm-ups are no-ops."""
+        def fake_ffmpeg(cmd, **kwargs):
+            Path(cmd[-1]).write_bytes(b"ID3silence")
+            return MagicMock(returncode=0)
+        mock_run.side_effect = fake_ffmpeg
+
+        warm_silence_cache(400)
+        warm_silence_cache(400)
+
+        mock_run.assert_called_once()
+        assert _silence_cache[400] == b"ID3silence"
+
 
 # ── stitch_audio ───────────────────────────────────────
 
@@ -68,6 +135,17 @@ class TestStitchAudio:
         assert "concat" in concat_cmd
         assert "-safe" in concat_cmd
 
+    @patch("src.audio.subprocess.run")
+    def test_stream_copies_without_reencode(self, mock_run):
+        """Concat step copies MP3 frames instead of re-encoding."""
+        mock_run.return_value = MagicMock(returncode=0)
+
+        stitch_audio([Path("/tmp/a.mp3"), Path("/tmp/b.mp3")], Path("/tmp/out.mp3"))
+
+        concat_cmd = mock_run.call_args_list[1][0][0]
+        assert concat_cmd[concat_cmd.index("-c:a") + 1] == "copy"
+        assert "libmp3lame" not in concat_cmd
+
     @patch("src.audio.subprocess.run")
     def test_concat_list_format(self, mock_run):
         """Concat list alternates segments and silence, no trailing silence."""
@@ -95,45 +173,92 @@ class TestStitchAudio:
         assert "seg_001.mp3" in lines[2]
 
     @patch("src.audio.subprocess.run")
-    def test_single_segment_no_silence(self, mock_run):
-        """Single segment produces no silence entries in concat list."""
+    def test_escapes_apostrophes_in_paths(self, mock_run):
+        """A ' in a segment path is escaped for the concat demuxer."""
         mock_run.return_value = MagicMock(returncode=0)
 
-        seg_paths = [Path("/tmp/seg_000.mp3")]
-
-        stitch_audio(seg_paths, Path("/tmp/out.mp3"))
+        stitch_audio([Path("/tmp/host's take.mp3"), Path("/tmp/b.mp3")], Path("/tmp/out.mp3"))
 
         concat_cmd = mock_run.call_args_list[1][0][0]
-        i_idx = concat_cmd.index("-i")
-        concat_list_path = Path(concat_cmd[i_idx + 1])
-        content = concat_list_path.read_text()
+        content = Path(concat_cmd[concat_cmd.index("-i") + 1]).read_text()
+        assert content.split("\n")[0] == "file '/tmp/host'\\''s take.mp3'"
 
+    @patch("src.audio.subprocess.run")
+    def test_single_segment_copied_without_ffmpeg(self, mock_run, tmp_path):
+        """A single segment is copied straight to the output."""
+        seg = tmp_path / "seg_000.mp3"
+        seg.write_bytes(b"ID3segment")
+        output = tmp_path / "out.mp3"
+
+        result = stitch_audio([seg], output)
+
+        assert result == output
+        assert output.read_bytes() == b"ID3segment"
+        mock_run.assert_not_called()
+
+    @patch("src.audio.subprocess.run")
+    def test_zero_pause_skips_silence(self, mock_run):
+        """pause_ms=0 concatenates segments back to back without generating silence."""
+        mock_run.return_value = MagicMock(returncode=0)
+
+        stitch_audio([Path("/tmp/seg_000.mp3"), Path("/tmp/seg_001.mp3")], Path("/tmp/out.mp3"), pause_ms=0)
+
+        mock_run.assert_called_once()
+        concat_cmd = mock_run.call_args[0][0]
+        content = Path(concat_cmd[concat_cmd.index("-i") + 1]).read_text()
         lines = [l for l in content.strip().split("\n") if l]
-        assert len(lines) == 1
-        assert "silence" not in lines[0]
+        assert len(lines) == 2
+        assert all("silence" not in l for l in lines)
 
 
 # ── get_mp3_duration_seconds ───────────────────────────
 
 
 class TestGetMp3DurationSeconds:
+    @patch("src.audio.MP3")
+    def test_reads_header_length(self, mock_mp3, tmp_path):
+        """Duration comes from the parsed MP3 header when available."""
+        mock_mp3.return_value.info.length = 485.7
+        mp3 = tmp_path / "episode.mp3"
+        mp3.write_bytes(b"\x00" * 10)
+
+        assert get_mp3_duration_seconds(mp3) == 485.7
+
+    @patch("src.audio.MP3")
+    def test_caches_by_path_and_mtime(self, mock_mp3, tmp_path):
+        """Unchanged file is parsed once; a rewrite is parsed again."""
+        import os
+        mock_mp3.return_value.info.length = 12.0
+        mp3 = tmp_path / "cached.mp3"
+        mp3.write_bytes(b"\x00" * 10)
+
+        get_mp3_duration_seconds(mp3)
+        get_mp3_duration_seconds(mp3)
+        assert mock_mp3.call_count == 1
+
+        st = mp3.stat()
+        os.utime(mp3, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        get_mp3_duration_seconds(mp3)
+        assert mock_mp3.call_count == 2
+
     def test_calculation(self, tmp_path):
-        """(1_000_000 * 8) / 128_000 == 62.5 seconds."""
+        """Unparseable file falls back to (1_000_000 * 8) / 32_000 == 250 seconds."""
         mp3 = tmp_path / "test.mp3"
-        mp3.write_bytes(b"\x00" * 1_000_000)
+        with open(mp3, "wb") as f:
+            f.truncate(1_000_000)  # sparse; reads back as unparseable zeros
 
         result = get_mp3_duration_seconds(mp3)
 
-        assert result == 62.5
+        assert result == 250.0
 
     def test_small_file(self, tmp_path):
         """Small file gives proportionally small duration."""
         mp3 = tmp_path / "small.mp3"
-        mp3.write_bytes(b"\x00" * 16_000)  # 16KB
+        mp3.write_bytes(b"\x00" * 4_000)  # 4KB
 
         result = get_mp3_duration_seconds(mp3)
 
-        assert result == 1.0  # (16000 * 8) / 128000 = 1.0
+        assert result == 1.0  # (4000 * 8) / 32000 = 1.0
 
 
 # ── format_duration_itunes ─────────────────────────────
@@ -4,6 +4,8 @@ from unittest.mock import patch, MagicMock
 import pytest
 
 from src.diff import (
+    _snapshot_cache,
+    warm_snapshot_cache,
     load_previous_snapshot,
     save_snapshot,
     diff_scrape,
@@ -12,6 +14,17 @@ from src.diff import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_snapshot_cache():
+    _snapshot_cache.clear()
+    yield
+    _snapshot_cache.clear()
+
+
+def _cat_file_blob(payload: bytes) -> bytes:
+    return b"deadbeef blob " + str(len(payload)).encode() + b"\n" + payload + b"\n"
+
+
 # ── load_previous_snapshot ─────────────────────────────
 
 
@@ -19,7 +32,18 @@ class TestLoadPreviousSnapshot:
     @patch("src.diff.subprocess.run")
     def test_returns_none_on_missing(self, mock_run):
         """If snapshots branch doesn't exist, return None."""
-        mock_run.return_value = MagicMock(returncode=128, stdout="", stderr="fatal: not a git repo")
+        mock_run.return_value = MagicMock(
+            returncode=0, stdout=b"origin/snapshots:snapshots/anthropic_blog.json missing\n"
+        )
+
+        result = load_previous_snapshot("anthropic_blog")
+
+        assert result is None
+
+    @patch("src.diff.subprocess.run")
+    def test_returns_none_on_git_failure(self, mock_run):
+        """If git itself fails, return None."""
+        mock_run.return_value = MagicMock(returncode=128, stdout=b"", stderr=b"fatal: not a git repo")
 
         result = load_previous_snapshot("anthropic_blog")
 
@@ -29,7 +53,7 @@ class TestLoadPreviousSnapshot:
     def test_returns_parsed_json(self, mock_run):
         """If snapshot exists, returns parsed JSON dict."""
         snapshot = {"fetched_at": "2025-03-01T00:00:00+00:00", "content_hash": "abc123", "raw_text": "hello"}
-        mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(snapshot))
+        mock_run.return_value = MagicMock(returncode=0, stdout=_cat_file_blob(json.dumps(snapshot).encode()))
 
         result = load_previous_snapshot("anthropic_release_notes")
 
@@ -38,12 +62,58 @@ class TestLoadPreviousSnapshot:
     @patch("src.diff.subprocess.run")
     def test_returns_none_on_invalid_json(self, mock_run):
         """If git returns non-JSON content, return None."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="not valid json {{{")
+        mock_run.return_value = MagicMock(returncode=0, stdout=_cat_file_blob(b"not valid json {{{"))
 
         result = load_previous_snapshot("bad_source")
 
         assert result is None
 
+    @patch("src.diff.subprocess.run")
+    def test_memoizes_reads(self, mock_run):
+        """A second load of the same source doesn't shell out again."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=_cat_file_blob(b'{"content_hash": "abc"}'))
+
+        load_previous_snapshot("anthropic_release_notes")
+        load_previous_snapshot("anthropic_release_notes")
+
+        assert mock_run.call_count == 1
+
+
+# ── warm_snapshot_cache ────────────────────────────────
+
+
+class TestWarmSnapshotCache:
+    @patch("src.diff.subprocess.run")
+    def test_batch_reads_and_serves_from_cache(self, mock_run):
+        """One cat-file --batch call fills the cache; later loads don't shell out."""
+        stdout = (
+            _cat_file_blob(json.dumps({"content_hash": "abc"}).encode())
+            + b"origin/snapshots:snapshots/missing_src.json missing\n"
+        )
+        mock_run.return_value = MagicMock(returncode=0, stdout=stdout)
+
+        warm_snapshot_cache(["cached_src", "missing_src"])
+
+        assert mock_run.call_count == 1
+        assert mock_run.call_args[0][0] == ["git", "cat-file", "--batch"]
+        assert mock_run.call_args[1]["input"] == (
+            b"origin/snapshots:snapshots/cached_src.json\n"
+            b"origin/snapshots:snapshots/missing_src.json\n"
+        )
+
+        assert load_previous_snapshot("cached_src") == {"content_hash": "abc"}
+        assert load_previous_snapshot("missing_src") is None
+        assert mock_run.call_count == 1
+
+    @patch("src.diff.subprocess.run")
+    def test_failure_leaves_cache_cold(self, mock_run):
+        """If the batch read fails, nothing is memoized."""
+        mock_run.return_value = MagicMock(returncode=128, stdout=b"", stderr=b"fatal")
+
+        warm_snapshot_cache(["some_src"])
+
+        assert "some_src" not in _snapshot_cache
+
 
 # ── save_snapshot ──────────────────────────────────────
 
@@ -64,9 +134,10 @@ class TestSaveSnapshot:
 
 
 class TestDiffScrape:
+    @patch("src.diff._save_snapshot_text")
     @patch("src.diff.save_snapshot")
     @patch("src.diff.load_previous_snapshot")
-    def test_detects_change(self, mock_load, mock_save):
+    def test_detects_change(self, mock_load, mock_save, mock_save_text):
         """Different content_hash means content changed."""
         mock_load.return_value = {
             "fetched_at": "2025-03-01T00:00:00+00:00",
@@ -78,6 +149,19 @@ class TestDiffScrape:
 
         assert result == "new content here"
         mock_save.assert_called_once()
+        mock_save_text.assert_called_once_with("anthropic_release_notes", "new content here")
+
+    @patch("src.diff.load_previous_snapshot")
+    def test_raw_text_saved_beside_json(self, mock_load, tmp_path):
+        """Snapshot JSON holds only the hash; the page text is a sibling .txt."""
+        mock_load.return_value = None
+
+        with patch("src.diff.SNAPSHOTS_DIR", tmp_path):
+            diff_scrape("anthropic_release_notes", "page text")
+
+        snapshot = json.loads((tmp_path / "anthropic_release_notes.json").read_text())
+        assert set(snapshot) == {"fetched_at", "content_hash"}
+        assert (tmp_path / "anthropic_release_notes.txt").read_text() == "page text"
 
     @patch("src.diff.save_snapshot")
     @patch("src.diff.load_previous_snapshot")
@@ -96,11 +180,12 @@ class TestDiffScrape:
         result = diff_scrape("anthropic_release_notes", text)
 
         assert result is None
-        mock_save.assert_called_once()
+        mock_save.assert_not_called()
 
+    @patch("src.diff._save_snapshot_text")
     @patch("src.diff.save_snapshot")
     @patch("src.diff.load_previous_snapshot")
-    def test_first_run_returns_all_text(self, mock_load, mock_save):
+    def test_first_run_returns_all_text(self, mock_load, mock_save, mock_save_text):
         """No previous snapshot — returns everything as new."""
         mock_load.return_value = None
 
@@ -155,6 +240,33 @@ class TestDiffSitemap:
 
         assert "https://example.com/page1" in result
 
+    @patch("src.diff.save_snapshot")
+    @patch("src.diff.load_previous_snapshot")
+    def test_preserves_sitemap_order(self, mock_load, mock_save):
+        """Results follow sitemap order; a lastmod dropped to None is not a change."""
+        mock_load.return_value = {
+            "fetched_at": "2025-03-01T00:00:00+00:00",
+            "urls": {
+                "https://example.com/b": "2025-02-01",
+                "https://example.com/d": "2025-02-01",
+            },
+        }
+
+        current = {
+            "https://example.com/a": None,
+            "https://example.com/b": "2025-03-05",
+            "https://example.com/c": "2025-03-01",
+            "https://example.com/d": None,
+        }
+
+        result = diff_sitemap("test_sitemap", current)
+
+        assert result == [
+            "https://example.com/a",
+            "https://example.com/b",
+            "https://example.com/c",
+        ]
+
     @patch("src.diff.save_snapshot")
     @patch("src.diff.load_previous_snapshot")
     def test_first_run_returns_all_urls(self, mock_load, mock_save):
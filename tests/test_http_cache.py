@@ -0,0 +1,59 @@
+from unittest.mock import patch
+
+import pytest
+import requests
+import responses
+
+from src.http_cache import conditional_get
+
+FEED_URL = "https://example.com/feed.xml"
+
+
+@pytest.fixture(autouse=True)
+def _isolated_http_cache(tmp_path):
+    with patch("src.http_cache.HTTP_CACHE_DIR", tmp_path / "http"):
+        yield
+
+
+# ── conditional_get ────────────────────────────────────
+
+
+class TestConditionalGet:
+    @responses.activate
+    def test_revalidates_and_reuses_body_on_304(self):
+        """Second fetch sends the stored validators; 304 returns the cached body."""
+        responses.add(
+            responses.GET, FEED_URL, body=b"<rss/>", status=200,
+            headers={"ETag": '"v1"', "Last-Modified": "Wed, 01 Oct 2025 00:00:00 GMT"},
+        )
+        responses.add(responses.GET, FEED_URL, status=304)
+        session = requests.Session()
+
+        first = conditional_get(session, FEED_URL, timeout=5)
+        second = conditional_get(session, FEED_URL, timeout=5)
+
+        assert first == second == b"<rss/>"
+        revalidation = responses.calls[1].request.headers
+        assert revalidation["If-None-Match"] == '"v1"'
+        assert revalidation["If-Modified-Since"] == "Wed, 01 Oct 2025 00:00:00 GMT"
+
+    @responses.activate
+    def test_no_validators_means_no_cache(self):
+        """Responses without ETag/Last-Modified are always fetched unconditionally."""
+        responses.add(responses.GET, FEED_URL, body=b"<rss/>", status=200)
+        responses.add(responses.GET, FEED_URL, body=b"<rss>new</rss>", status=200)
+        session = requests.Session()
+
+        conditional_get(session, FEED_URL, timeout=5)
+        second = conditional_get(session, FEED_URL, timeout=5)
+
+        assert second == b"<rss>new</rss>"
+        assert "If-None-Match" not in responses.calls[1].request.headers
+
+    @responses.activate
+    def test_raises_on_http_error(self):
+        """HTTP errors propagate to the caller."""
+        responses.add(responses.GET, FEED_URL, status=500)
+
+        with pytest.raises(requests.HTTPError):
+            conditional_get(requests.Session(), FEED_URL, timeout=5)
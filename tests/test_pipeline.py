@@ -1,5 +1,6 @@
 import json
 from pathlib import Path
+from types import MappingProxyType
 from unittest.mock import patch, MagicMock
 
 import pytest
@@ -7,10 +8,17 @@ import pytest
 from src.pipeline import run_pipeline
 
 
-# ── Fixtures ───────────────────────────────────────────
+@pytest.fixture(autouse=True)
+def _isolated_episodes_dir(tmp_path):
+    """Stitched episodes land in tmp_path, never in the published site/episodes."""
+    with patch("src.pipeline.EPISODES_DIR", tmp_path / "episodes"):
+        yield
+
 
+# ── Fixtures ───────────────────────────────────────────
 
-SAMPLE_CONTENT = {
+# Shared by every test, so read-only at the top level
+SAMPLE_CONTENT = MappingProxyType({
     "anthropic": [
         {
             "title": "Claude Update",
@@ -25,16 +33,16 @@ SAMPLE_CONTENT = {
     "openai": [],
     "gemini": [],
     "errors": [],
-}
+})
 
-EMPTY_CONTENT = {
+EMPTY_CONTENT = MappingProxyType({
     "anthropic": [],
     "openai": [],
     "gemini": [],
     "errors": [{"source": "all_failed", "error": "timeout"}],
-}
+})
 
-SAMPLE_SUMMARY = {
+SAMPLE_SUMMARY = MappingProxyType({
     "themes": [
         {
             "name": "Model Updates",
@@ -51,9 +59,9 @@ SAMPLE_SUMMARY = {
         },
     ],
     "meta": {"total_items_processed": 1, "items_after_dedup": 1, "week_ending": "2025-03-05"},
-}
+})
 
-EMPTY_SUMMARY = {"themes": [], "meta": {}}
+EMPTY_SUMMARY = MappingProxyType({"themes": [], "meta": {}})
 
 SAMPLE_SEGMENTS = [
     {"speaker": "interviewer", "text": "Welcome to the show."},
@@ -105,6 +113,7 @@ class TestRunPipeline:
         assert result["themes_count"] == 1
         assert result["mp3_path"] is None
 
+    @patch("src.pipeline.warm_silence_cache")
     @patch("src.pipeline.update_feed")
     @patch("src.pipeline.create_episode_item")
     @patch("src.pipeline.get_episode_metadata")
@@ -123,6 +132,7 @@ class TestRunPipeline:
         mock_meta,
         mock_item,
         mock_feed,
+        mock_warm,
         tmp_path,
     ):
         """Full pipeline run produces status 'published' with episode metadata."""
@@ -134,7 +144,8 @@ class TestRunPipeline:
         # stitch_audio writes to the output path
         def fake_stitch(paths, output_path, **kwargs):
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_bytes(b"\x00" * 500_000)
+            with open(output_path, "wb") as f:
+                f.truncate(500_000)  # sparse: the size is all that matters
             return output_path
 
         mock_stitch.side_effect = fake_stitch
@@ -157,8 +168,10 @@ class TestRunPipeline:
         assert result["duration"] == "00:08:32"
         assert result["segments_count"] == 4
         assert result["themes_count"] == 1
+        assert mock_stitch.call_args.args[1].parent == tmp_path / "episodes"
         mock_feed.assert_called_once()
 
+    @patch("src.pipeline.warm_silence_cache")
     @patch("src.pipeline.send_episode_email")
     @patch("src.pipeline._try_smtp_creds")
     @patch("src.pipeline.update_feed")
@@ -171,7 +184,7 @@ class TestRunPipeline:
     @patch("src.pipeline.ingest_all")
     def test_ai_industry_sends_email_without_action_items(
         self, mock_ingest, mock_summarize, mock_script, mock_tts, mock_stitch,
-        mock_meta, mock_item, mock_feed, mock_creds, mock_send_email, tmp_path,
+        mock_meta, mock_item, mock_feed, mock_creds, mock_send_email, mock_warm, tmp_path,
     ):
         """AI Industry pipeline sends an email digest with action_items=None."""
         mock_ingest.return_value = SAMPLE_CONTENT
@@ -181,7 +194,8 @@ class TestRunPipeline:
 
         def fake_stitch(paths, output_path, **kwargs):
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_bytes(b"\x00" * 500_000)
+            with open(output_path, "wb") as f:
+                f.truncate(500_000)  # sparse: the size is all that matters
             return output_path
         mock_stitch.side_effect = fake_stitch
         mock_meta.return_value = {
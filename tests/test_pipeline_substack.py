@@ -1,4 +1,5 @@
 import json
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -144,6 +145,46 @@ class TestSubstackDryRun:
         per_item_arg = mock_aggregate.call_args.args[0]
         assert len(per_item_arg) == 2
 
+    @patch("src.pipeline.SubstackPMSource")
+    @patch("src.pipeline.summarize_one")
+    @patch("src.pipeline.aggregate_summarize")
+    @patch("src.pipeline.load_memory_slices")
+    @patch("src.pipeline.generate_action_items")
+    @patch("src.pipeline.generate_substack_script")
+    def test_summarizes_newsletters_concurrently_in_order(
+        self, mock_script, mock_actions, mock_load_mem, mock_aggregate,
+        mock_summarize_one, mock_src_cls,
+    ):
+        urls = ["https://l.com/p/1", "https://l.com/p/2"]
+        items = [_content_item(f"m{i}", f"Post {i}", urls[i]) for i in range(2)]
+        src_instance = MagicMock()
+        src_instance.fetch.return_value = items
+        mock_src_cls.return_value = src_instance
+
+        # Both calls must be in flight at once to get past the barrier;
+        # the second finishes first, but order still follows the items.
+        barrier = threading.Barrier(2, timeout=5)
+        second_done = threading.Event()
+
+        def _summarize(item):
+            barrier.wait()
+            if item["url"] == urls[0]:
+                second_done.wait(timeout=5)
+            else:
+                second_done.set()
+            return _newsletter_summary(item["url"])
+
+        mock_summarize_one.side_effect = _summarize
+        mock_aggregate.return_value = _aggregate()
+        mock_load_mem.return_value = {"role": "PM", "projects": "Port"}
+        mock_actions.return_value = _action_items(urls)
+        mock_script.return_value = _script_segments()
+
+        run_pipeline(source="substack_pm", dry_run=True)
+
+        per_item_arg = mock_aggregate.call_args.args[0]
+        assert [s["url"] for s in per_item_arg] == urls
+
     @patch("src.pipeline.SubstackPMSource")
     @patch("src.pipeline.summarize_one")
     def test_all_summaries_failing_aborts(self, mock_summarize_one, mock_src_cls):
@@ -176,6 +217,7 @@ class TestSubstackDryRun:
 
 
 class TestSubstackPublish:
+    @patch("src.pipeline.warm_silence_cache")
     @patch("src.pipeline.SubstackPMSource")
     @patch("src.pipeline.summarize_one")
     @patch("src.pipeline.aggregate_summarize")
@@ -190,6 +232,7 @@ class TestSubstackPublish:
         self,
         mock_get_meta, mock_update_feed, mock_stitch, mock_synth, mock_script,
         mock_actions, mock_load_mem, mock_aggregate, mock_summarize_one, mock_src_cls,
+        mock_warm,
     ):
         urls = ["https://l.com/p/1"]
         src_instance = MagicMock()
@@ -222,6 +265,7 @@ class TestSubstackPublish:
         assert "channel_config" in kwargs
         assert kwargs["channel_config"]["PODCAST_TITLE"] == "Substack PM Weekly"
 
+    @patch("src.pipeline.warm_silence_cache")
     @patch("src.pipeline.send_episode_email")
     @patch("src.pipeline._try_smtp_creds")
     @patch("src.pipeline.SubstackPMSource")
@@ -237,7 +281,7 @@ class TestSubstackPublish:
     def test_full_run_sends_email_with_action_items(
         self, mock_get_meta, mock_update_feed, mock_stitch, mock_synth, mock_script,
         mock_actions, mock_load_mem, mock_aggregate, mock_summarize_one,
-        mock_src_cls, mock_creds, mock_send_email,
+        mock_src_cls, mock_creds, mock_send_email, mock_warm,
     ):
         urls = ["https://l.com/p/1"]
         src_instance = MagicMock()
@@ -9,6 +9,7 @@ from src.publish import (
     create_initial_feed,
     get_episode_metadata,
     update_feed,
+    _splice_item,
     ITUNES_NS,
     TEMPLATE_PATH,
 )
@@ -19,6 +20,9 @@ from src.publish import (
 
 ITUNES = {"itunes": ITUNES_NS}
 
+# One parser for every feed read-back; tests run serially, so sharing is safe
+_PARSER = etree.XMLParser(collect_ids=False, resolve_entities=False)
+
 SAMPLE_METADATA = {
     "title": "AI Industry Weekly — March 5, 2025",
     "file_name": "episode_2025-03-05.mp3",
@@ -53,7 +57,8 @@ class TestGetEpisodeMetadata:
     def test_returns_all_fields(self, tmp_path):
         """Metadata dict has all required keys."""
         mp3 = tmp_path / "episode.mp3"
-        mp3.write_bytes(b"\x00" * 1_000_000)
+        with open(mp3, "wb") as f:
+            f.truncate(1_000_000)  # sparse: the size is all that matters
 
         meta = get_episode_metadata(mp3, "https://example.github.io/pod")
 
@@ -126,7 +131,7 @@ class TestUpdateFeed:
         item2 = create_episode_item({**SAMPLE_METADATA, "guid": "episode_2025-03-08", "title": "Episode 2"})
         update_feed(feed_path, item2)
 
-        tree = etree.parse(str(feed_path))
+        tree = etree.parse(str(feed_path), _PARSER)
         items = tree.findall(".//item")
         assert len(items) == 2
         # Most recent episode should be first
@@ -148,7 +153,7 @@ class TestUpdateFeed:
             update_feed(feed_path, item)
 
         assert feed_path.exists()
-        tree = etree.parse(str(feed_path))
+        tree = etree.parse(str(feed_path), _PARSER)
         channel = tree.find(".//channel")
         assert channel.findtext("title") == "AI Industry Weekly"
         items = tree.findall(".//item")
@@ -164,6 +169,89 @@ class TestUpdateFeed:
         assert content.startswith("<?xml version=")
         assert "UTF-8" in content.split("\n")[0]
 
+    def test_splice_matches_full_rewrite(self, tmp_path):
+        """In-place insert leaves earlier bytes untouched and matches a full rewrite."""
+        from unittest.mock import patch
+        config = {"PODCAST_AUTHOR": "Test Author", "PODCAST_EMAIL": "test@example.com"}
+        fast_path = _make_feed_xml(tmp_path)
+        update_feed(fast_path, create_episode_item({**SAMPLE_METADATA, "title": "Episode 1"}), config)
+        full_path = tmp_path / "full.xml"
+        shutil.copy(fast_path, full_path)
+        before = fast_path.read_bytes()
+
+        item2 = {**SAMPLE_METADATA, "title": "Episode 2"}
+        update_feed(fast_path, create_episode_item(item2), config)
+        with patch("src.publish._splice_item", return_value=False):
+            update_feed(full_path, create_episode_item(item2), config)
+
+        def canonical(path):
+            parser = etree.XMLParser(remove_blank_text=True)
+            return etree.tostring(etree.parse(str(path), parser), method="c14n")
+
+        after = fast_path.read_bytes()
+        assert canonical(fast_path) == canonical(full_path)
+        head = before[:before.index(b"<item>")]
+        assert after.startswith(head)
+        assert b"<itunes:duration>" in after
+        assert b"xmlns:itunes" not in after[len(head):]
+
+    def test_failed_splice_leaves_feed_intact(self, tmp_path):
+        """A write that fails mid-splice leaves feed.xml as it was, with no temp file."""
+        from unittest.mock import patch
+        feed_path = _make_feed_xml(tmp_path)
+        before = feed_path.read_bytes()
+
+        class DiskFullAfterFirstWrite:
+            def __init__(self, f):
+                self._f, self._writes = f, 0
+
+            def __getattr__(self, name):
+                return getattr(self._f, name)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                self._f.close()
+
+            def write(self, data):
+                self._writes += 1
+                if self._writes > 1:
+                    raise OSError(28, "No space left on device")
+                return self._f.write(data)
+
+        def disk_full_open(path, mode="r", *args, **kwargs):
+            f = open(path, mode, *args, **kwargs)
+            return DiskFullAfterFirstWrite(f) if "w" in mode or "+" in mode else f
+
+        with patch("src.publish.open", disk_full_open, create=True):
+            assert _splice_item(feed_path, create_episode_item(SAMPLE_METADATA)) is False
+
+        assert feed_path.read_bytes() == before
+        assert list(tmp_path.iterdir()) == [feed_path]
+
+    def test_metadata_sync_keeps_existing_formatting(self, tmp_path):
+        """Syncing changed channel metadata doesn't re-indent the feed."""
+        feed_path = _make_feed_xml(tmp_path)
+        config = {"PODCAST_AUTHOR": "Test Author", "PODCAST_EMAIL": "test@example.com"}
+        update_feed(feed_path, create_episode_item(SAMPLE_METADATA), config)
+        before = feed_path.read_text()
+
+        update_feed(
+            feed_path,
+            create_episode_item({**SAMPLE_METADATA, "title": "Episode 2"}),
+            {**config, "PODCAST_AUTHOR": "New Author"},
+        )
+
+        after = feed_path.read_text()
+        channel = etree.parse(str(feed_path), _PARSER).find(".//channel")
+        assert channel.findtext(f"{{{ITUNES_NS}}}author") == "New Author"
+        assert [i.findtext("title") for i in channel.findall("item")] == [
+            "Episode 2", SAMPLE_METADATA["title"],
+        ]
+        old_item = before[before.index("    <item>"):before.index("</channel>")]
+        assert after.rstrip().endswith(old_item + "</channel>\n</rss>")
+
 
 # ── create_initial_feed ────────────────────────────────
 
@@ -206,6 +294,17 @@ class TestCreateInitialFeed:
 
         assert feed_path.exists()
 
+    def test_values_are_not_rescanned_for_placeholders(self, tmp_path):
+        """A value containing another placeholder is inserted literally."""
+        feed_path = tmp_path / "feed.xml"
+        create_initial_feed(
+            TEMPLATE_PATH,
+            feed_path,
+            {"PODCAST_TITLE": "{PODCAST_AUTHOR} Weekly", "PODCAST_AUTHOR": "Jane Doe"},
+        )
+
+        assert "<title>{PODCAST_AUTHOR} Weekly</title>" in feed_path.read_text()
+
 
 # ── Metadata sync ─────────────────────────────────────
 
@@ -222,7 +321,7 @@ class TestMetadataSync:
         )
 
         # Verify they're empty
-        tree = etree.parse(str(feed_path))
+        tree = etree.parse(str(feed_path), _PARSER)
         channel = tree.find(".//channel")
         assert channel.findtext(f"{{{ITUNES_NS}}}author") == ""
 
@@ -234,7 +333,7 @@ class TestMetadataSync:
             update_feed(feed_path, item)
 
         # Verify metadata was synced
-        tree = etree.parse(str(feed_path))
+        tree = etree.parse(str(feed_path), _PARSER)
         channel = tree.find(".//channel")
         assert channel.findtext(f"{{{ITUNES_NS}}}author") == "Fixed Author"
         assert channel.findtext(f"{{{ITUNES_NS}}}email") == "fixed@example.com"
@@ -279,7 +378,7 @@ class TestSubstackFeedParameterization:
         item = create_episode_item(SAMPLE_METADATA)
         update_feed(feed_path, item, channel_config=sub_config)
 
-        tree = etree.parse(str(feed_path))
+        tree = etree.parse(str(feed_path), _PARSER)
         channel = tree.find(".//channel")
         assert channel.findtext("title") == "Substack PM Weekly"
         assert channel.findtext("description") == "Weekly substack PM digest."
@@ -290,7 +389,7 @@ class TestSubstackFeedParameterization:
         item = create_episode_item(SAMPLE_METADATA)
         update_feed(feed_path, item)
 
-        tree = etree.parse(str(feed_path))
+        tree = etree.parse(str(feed_path), _PARSER)
         channel = tree.find(".//channel")
         assert channel.findtext("title") == "AI Industry Weekly"
 
@@ -303,7 +402,7 @@ class TestWorkflowConsistency:
         """Every file the workflow git-adds must use -f if matched by .gitignore."""
         import re
         from pathlib import Path
-        from fnmatch import fnmatch
+        from fnmatch import translate
 
         root = Path(__file__).resolve().parent.parent
         gitignore_path = root / ".gitignore"
@@ -312,12 +411,19 @@ class TestWorkflowConsistency:
         if not gitignore_path.exists() or not workflow_path.exists():
             pytest.skip("Missing .gitignore or workflow file")
 
-        # Parse gitignore patterns
-        patterns = []
+        # Compile gitignore patterns into two regexes, once: "/"-anchored
+        # patterns match only a path's first component, the rest match any
+        anchored, anywhere = [], []
         for line in gitignore_path.read_text().splitlines():
             line = line.strip()
             if line and not line.startswith("#"):
-                patterns.append(line.rstrip("/"))
+                pattern = line.rstrip("/")
+                if pattern.startswith("/"):
+                    anchored.append(translate(pattern[1:]))
+                else:
+                    anywhere.append(translate(pattern))
+        anchored_re = re.compile("|".join(anchored) or "(?!)")
+        anywhere_re = re.compile("|".join(anywhere) or "(?!)")
 
         # Extract all 'git add' commands from workflow
         workflow = workflow_path.read_text()
@@ -329,12 +435,11 @@ class TestWorkflowConsistency:
             paths = [p for p in line.split() if not p.startswith("-")]
 
             for path in paths:
-                for pattern in patterns:
-                    # Check if any component of the path matches a gitignore pattern
-                    path_parts = path.rstrip("/").split("/")
-                    for part in path_parts:
-                        if fnmatch(part, pattern) or fnmatch(part + "/", pattern + "/"):
-                            assert has_force, (
-                                f"Workflow 'git add {path}' matches .gitignore pattern "
-                                f"'{pattern}' but does not use -f flag"
-                            )
+                path_parts = path.rstrip("/").split("/")
+                ignored = anchored_re.match(path_parts[0]) or any(
+                    anywhere_re.match(part) for part in path_parts
+                )
+                assert has_force or not ignored, (
+                    f"Workflow 'git add {path}' matches .gitignore "
+                    f"but does not use -f flag"
+                )
@@ -0,0 +1,98 @@
+from unittest.mock import patch
+
+import requests
+import responses
+from urllib3.response import HTTPResponse
+
+from src.ratelimit import MAX_PAUSE_S, CappedRetry, HostLimiter, RateLimitedAdapter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _limiter(clock: FakeClock) -> HostLimiter:
+    return HostLimiter(clock=clock, sleep=clock.sleep)
+
+
+# ── HostLimiter ────────────────────────────────────────
+
+
+class TestHostLimiter:
+    def test_retry_after_pauses_only_that_host(self):
+        """A 429 with Retry-After delays the next request to the same host."""
+        clock = FakeClock()
+        limiter = _limiter(clock)
+
+        limiter.update("a.com", 429, {"Retry-After": "5"})
+        limiter.wait("b.com")
+        limiter.wait("a.com")
+        limiter.wait("a.com")
+
+        assert clock.sleeps == [5.0]
+
+    def test_exhausted_quota_waits_for_reset(self):
+        """X-RateLimit-Remaining: 0 pauses until X-RateLimit-Reset, capped."""
+        clock = FakeClock()
+        limiter = _limiter(clock)
+
+        limiter.update("a.com", 200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "3"})
+        limiter.wait("a.com")
+        limiter.update("a.com", 200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "3600"})
+        limiter.wait("a.com")
+
+        assert clock.sleeps == [3.0, MAX_PAUSE_S]
+
+    def test_ignores_responses_without_limit_signal(self):
+        """Plain responses, and Retry-After on a success, never pause."""
+        clock = FakeClock()
+        limiter = _limiter(clock)
+
+        limiter.update("a.com", 200, {"X-RateLimit-Remaining": "10", "Retry-After": "5"})
+        limiter.wait("a.com")
+
+        assert clock.sleeps == []
+
+
+# ── RateLimitedAdapter ─────────────────────────────────
+
+
+class TestRateLimitedAdapter:
+    @responses.activate
+    def test_records_final_response_headers(self):
+        """The adapter feeds rate-limit headers to the limiter per host."""
+        responses.add(responses.GET, "https://a.com/x", status=429, headers={"Retry-After": "2"})
+        responses.add(responses.GET, "https://a.com/x", status=200)
+        clock = FakeClock()
+        session = requests.Session()
+        session.mount("https://", RateLimitedAdapter(_limiter(clock)))
+
+        session.get("https://a.com/x")
+        session.get("https://a.com/x")
+
+        assert clock.sleeps == [2.0]
+
+
+# ── CappedRetry ────────────────────────────────────────
+
+
+class TestCappedRetry:
+    @patch("urllib3.util.retry.time.sleep")
+    def test_caps_retry_after_sleep(self, mock_sleep):
+        """urllib3's in-adapter Retry-After sleep never exceeds MAX_PAUSE_S."""
+        retry = CappedRetry(total=3, status_forcelist=[429]).new()
+
+        retry.sleep(HTTPResponse(status=429, headers={"Retry-After": "3600"}))
+        retry.sleep(HTTPResponse(status=429, headers={"Retry-After": "5"}))
+
+        assert isinstance(retry, CappedRetry)
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [MAX_PAUSE_S, 5.0]
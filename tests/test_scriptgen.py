@@ -4,7 +4,12 @@ from unittest.mock import patch, MagicMock
 import anthropic
 import pytest
 
-from src.scriptgen import build_script_prompt, parse_script, generate_script
+from src.scriptgen import (
+    API_MAX_RETRIES,
+    build_script_prompt,
+    generate_script,
+    parse_script,
+)
 
 
 # ── Fixtures ───────────────────────────────────────────
@@ -49,14 +54,6 @@ VALID_SCRIPT = """[INTERVIEWER]: Welcome back to AI Industry Weekly! Big week in
 BAD_SCRIPT = "Here is a podcast script about AI news this week. The hosts discuss new models."
 
 
-def _mock_response(text):
-    content_block = MagicMock()
-    content_block.text = text
-    response = MagicMock()
-    response.content = [content_block]
-    return response
-
-
 # ── parse_script ───────────────────────────────────────
 
 
@@ -69,6 +66,15 @@ class TestParseScript:
         assert all(s["speaker"] in ("interviewer", "expert") for s in segments)
         assert all(len(s["text"]) > 0 for s in segments)
 
+    def test_tag_without_text_does_not_swallow_next_turn(self):
+        """An empty turn is dropped; the following tag still starts its own segment."""
+        raw = "[INTERVIEWER]: One\n[EXPERT]:\n[INTERVIEWER]: Two\n[EXPERT]: Three\n[INTERVIEWER]: Four\n"
+
+        segments = parse_script(raw)
+
+        assert [s["text"] for s in segments] == ["One", "Two", "Three", "Four"]
+        assert segments[1]["speaker"] == "interviewer"
+
     def test_rejects_too_few_segments(self):
         """Fewer than 4 segments raises ValueError."""
         short = "[INTERVIEWER]: Hello\n[EXPERT]: Hi\n"
@@ -110,29 +116,28 @@ class TestParseScript:
 # ── generate_script ────────────────────────────────────
 
 
+@patch("src.scriptgen.anthropic.Anthropic")
 class TestGenerateScript:
-    @patch("src.scriptgen.anthropic.Anthropic")
-    def test_returns_segments_on_success(self, mock_anthropic_cls):
+    def test_returns_segments_on_success(self, mock_anthropic_cls, mock_response):
         """Valid response is parsed into segments."""
         mock_client = MagicMock()
         mock_anthropic_cls.return_value = mock_client
-        mock_client.messages.create.return_value = _mock_response(VALID_SCRIPT)
+        mock_client.messages.create.return_value = mock_response(VALID_SCRIPT)
 
         segments = generate_script(SAMPLE_THEMES)
 
         assert len(segments) >= 4
         assert segments[0]["speaker"] == "interviewer"
 
-    @patch("src.scriptgen.anthropic.Anthropic")
-    def test_retries_on_bad_format(self, mock_anthropic_cls):
+    def test_retries_on_bad_format(self, mock_anthropic_cls, mock_response):
         """If parse_script fails, retries with format correction."""
         mock_client = MagicMock()
         mock_anthropic_cls.return_value = mock_client
 
         # First call returns untagged text, second returns valid script
         mock_client.messages.create.side_effect = [
-            _mock_response(BAD_SCRIPT),
-            _mock_response(VALID_SCRIPT),
+            mock_response(BAD_SCRIPT),
+            mock_response(VALID_SCRIPT),
         ]
 
         segments = generate_script(SAMPLE_THEMES)
@@ -143,37 +148,38 @@ class TestGenerateScript:
         second_call_messages = mock_client.messages.create.call_args_list[1][1]["messages"]
         assert any("[INTERVIEWER]:" in m.get("content", "") for m in second_call_messages)
 
-    @patch("src.scriptgen.anthropic.Anthropic")
-    def test_raises_on_persistent_bad_format(self, mock_anthropic_cls):
+    def test_raises_on_persistent_bad_format(self, mock_anthropic_cls, mock_response):
         """If both attempts produce bad format, raises ValueError."""
         mock_client = MagicMock()
         mock_anthropic_cls.return_value = mock_client
-        mock_client.messages.create.return_value = _mock_response(BAD_SCRIPT)
+        mock_client.messages.create.return_value = mock_response(BAD_SCRIPT)
 
         with pytest.raises(ValueError):
             generate_script(SAMPLE_THEMES)
 
-    @patch("src.scriptgen.time.sleep")
-    @patch("src.scriptgen.anthropic.Anthropic")
-    def test_retries_on_api_error(self, mock_anthropic_cls, mock_sleep):
-        """429/500/503 triggers retry with backoff."""
+    def test_delegates_retries_to_sdk_client(self, mock_anthropic_cls, mock_response):
+        """One client with SDK-side retries serves both attempts."""
         mock_client = MagicMock()
         mock_anthropic_cls.return_value = mock_client
-
-        error_503 = anthropic.APIStatusError(
-            message="overloaded",
-            response=MagicMock(status_code=503),
-            body={"error": {"message": "overloaded"}},
-        )
         mock_client.messages.create.side_effect = [
-            error_503,
-            _mock_response(VALID_SCRIPT),
+            mock_response(BAD_SCRIPT),
+            mock_response(VALID_SCRIPT),
         ]
 
-        segments = generate_script(SAMPLE_THEMES)
+        generate_script(SAMPLE_THEMES)
 
-        assert len(segments) >= 4
-        assert mock_sleep.call_count == 1
+        mock_anthropic_cls.assert_called_once()
+        assert mock_anthropic_cls.call_args.kwargs["max_retries"] == API_MAX_RETRIES
+
+    def test_raises_api_error(self, mock_anthropic_cls, api_error):
+        """Errors surfacing after the SDK's retries propagate."""
+        mock_client = MagicMock()
+        mock_anthropic_cls.return_value = mock_client
+        mock_client.messages.create.side_effect = api_error(503)
+
+        with pytest.raises(anthropic.APIStatusError):
+            generate_script(SAMPLE_THEMES)
+        assert mock_client.messages.create.call_count == 1
 
 
 # ── build_script_prompt ────────────────────────────────
@@ -187,3 +193,9 @@ class TestBuildScriptPrompt:
         parsed = json.loads(result)
         assert "themes" in parsed
         assert parsed["themes"][0]["name"] == "New Model Releases"
+
+    def test_prompt_is_minified(self):
+        """No indentation or separator padding is sent as prompt tokens."""
+        result = build_script_prompt(SAMPLE_THEMES)
+
+        assert result == json.dumps(SAMPLE_THEMES, separators=(",", ":"), ensure_ascii=False)
@@ -1,16 +1,30 @@
 import json
+from types import MappingProxyType
 from unittest.mock import patch, MagicMock
 
 import anthropic
 import pytest
 
-from src.summarize import build_summarize_prompt, summarize, _try_parse_json, _validate_summarize_output
+from src.summarize import (
+    MAX_PROMPT_CHARS,
+    _try_parse_json,
+    _validate_summarize_output,
+    build_summarize_prompt,
+    summarize,
+)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_summary_cache(tmp_path):
+    with patch("src.summarize.SUMMARIZE_CACHE_DIR", tmp_path / "summarize"):
+        yield
 
 
 # ── Fixtures ───────────────────────────────────────────
 
 
-SAMPLE_CONTENT = {
+# Shared by every test, so read-only at the top level
+SAMPLE_CONTENT = MappingProxyType({
     "anthropic": [
         {
             "title": "Claude 4.5 Haiku Released",
@@ -35,9 +49,9 @@ SAMPLE_CONTENT = {
     ],
     "gemini": [],
     "errors": [],
-}
+})
 
-VALID_SUMMARIZE_RESPONSE = json.dumps({
+_VALID_SUMMARIZE_DICT = {
     "themes": [
         {
             "name": "New Model Releases",
@@ -64,16 +78,27 @@ VALID_SUMMARIZE_RESPONSE = json.dumps({
         "items_after_dedup": 2,
         "week_ending": "2025-03-05",
     },
-})
-
-
-def _mock_response(text):
-    """Build a mock Claude API response with the given text."""
-    content_block = MagicMock()
-    content_block.text = text
-    response = MagicMock()
-    response.content = [content_block]
-    return response
+}
+VALID_SUMMARIZE_RESPONSE = json.dumps(_VALID_SUMMARIZE_DICT, separators=(",", ":"))
+
+
+def _big_content(n, summary="Item summary."):
+    """n items for each provider, shaped like SAMPLE_CONTENT."""
+    return {
+        provider: [
+            {
+                "title": f"{provider} item {i}",
+                "url": f"https://{provider}.example/{i}",
+                "summary": summary,
+                "published": "2025-03-01T00:00:00+00:00",
+                "source_name": f"{provider}_blog",
+                "provider": provider,
+                "method": "rss",
+            }
+            for i in range(n)
+        ]
+        for provider in ("anthropic", "openai", "gemini")
+    } | {"errors": []}
 
 
 # ── build_summarize_prompt ─────────────────────────────
@@ -103,17 +128,33 @@ class TestBuildSummarizePrompt:
         assert "ERRORS" in prompt
         assert "bad_src" in prompt
 
+    def test_truncates_at_char_cap(self):
+        """Prompts past MAX_PROMPT_CHARS are cut at the cap and marked."""
+        with patch("src.summarize.MAX_PROMPT_CHARS", 120):
+            prompt = build_summarize_prompt(SAMPLE_CONTENT)
+
+        body, marker = prompt.split("\n\n[TRUNCATED")
+        assert len(body) == 120
+        assert marker.startswith(" — content exceeded limit]")
+
+    def test_large_week_stays_within_char_budget(self):
+        """A week far past the budget is still cut to MAX_PROMPT_CHARS."""
+        prompt = build_summarize_prompt(_big_content(50, summary="x" * 5_000))
+
+        body = prompt.split("\n\n[TRUNCATED")[0]
+        assert len(body) == MAX_PROMPT_CHARS
+
 
 # ── summarize ──────────────────────────────────────────
 
 
+@patch("src.summarize.anthropic.Anthropic")
 class TestSummarize:
-    @patch("src.summarize.anthropic.Anthropic")
-    def test_returns_valid_structure(self, mock_anthropic_cls):
+    def test_returns_valid_structure(self, mock_anthropic_cls, mock_response):
         """Output has 'themes' list and 'meta' dict."""
         mock_client = MagicMock()
         mock_anthropic_cls.return_value = mock_client
-        mock_client.messages.create.return_value = _mock_response(VALID_SUMMARIZE_RESPONSE)
+        mock_client.messages.create.return_value = mock_response(VALID_SUMMARIZE_RESPONSE)
 
         result = summarize(SAMPLE_CONTENT)
 
@@ -121,17 +162,37 @@ class TestSummarize:
         assert isinstance(result["themes"], list)
         assert len(result["themes"]) >= 1
         assert "meta" in result
+        assert result == _VALID_SUMMARIZE_DICT
+
+    def test_batches_every_item_into_one_call(self, mock_anthropic_cls, mock_response):
+        """The whole week goes to Claude in one request, not one per item.
+
+        One batched prompt keeps a weekly run to a single request (plus the
+        correction retry) regardless of item count; per-item calls would
+        multiply latency and run into RPM limits.
+        """
+        mock_client = MagicMock()
+        mock_anthropic_cls.return_value = mock_client
+        mock_client.messages.create.return_value = mock_response(VALID_SUMMARIZE_RESPONSE)
 
-    @patch("src.summarize.anthropic.Anthropic")
-    def test_retries_on_invalid_json(self, mock_anthropic_cls):
+        summarize(_big_content(20))
+
+        mock_client.messages.create.assert_called_once()
+        (user_turn,) = mock_client.messages.create.call_args.kwargs["messages"]
+        user_message = user_turn["content"][0]["text"]
+        for provider in ("anthropic", "openai", "gemini"):
+            assert f"{provider} item 0" in user_message
+            assert f"{provider} item 19" in user_message
+
+    def test_retries_on_invalid_json(self, mock_anthropic_cls, mock_response):
         """If first response isn't JSON, retries with correction message."""
         mock_client = MagicMock()
         mock_anthropic_cls.return_value = mock_client
 
         # First call returns garbage, second returns valid JSON
         mock_client.messages.create.side_effect = [
-            _mock_response("Here are the themes: not json"),
-            _mock_response(VALID_SUMMARIZE_RESPONSE),
+            mock_response("Here are the themes: not json"),
+            mock_response(VALID_SUMMARIZE_RESPONSE),
         ]
 
         result = summarize(SAMPLE_CONTENT)
@@ -139,73 +200,120 @@ class TestSummarize:
         assert "themes" in result
         # Two calls: original + retry with correction
         assert mock_client.messages.create.call_count == 2
+        # Both go through the one shared client
+        mock_anthropic_cls.assert_called_once()
         # The retry message list should include the correction
         second_call_messages = mock_client.messages.create.call_args_list[1][1]["messages"]
         assert any("valid JSON" in m.get("content", "") for m in second_call_messages)
 
-    @patch("src.summarize.time.sleep")
-    @patch("src.summarize.anthropic.Anthropic")
-    def test_retries_on_api_error(self, mock_anthropic_cls, mock_sleep):
+    def test_system_prompt_is_cached_prefix(self, mock_anthropic_cls, mock_response):
+        """System prompt and bulk content are cache breakpoints ahead of the correction turns."""
+        mock_client = MagicMock()
+        mock_anthropic_cls.return_value = mock_client
+        mock_client.messages.create.side_effect = [
+            mock_response("not json"),
+            mock_response(VALID_SUMMARIZE_RESPONSE),
+        ]
+
+        summarize(SAMPLE_CONTENT)
+
+        first, retry = (c.kwargs for c in mock_client.messages.create.call_args_list)
+        assert first["system"] == retry["system"]
+        assert first["system"][0]["cache_control"] == {"type": "ephemeral"}
+        content_block = retry["messages"][0]["content"][0]
+        assert content_block["cache_control"] == {"type": "ephemeral"}
+        assert "Claude 4.5 Haiku Released" in content_block["text"]
+        assert [m["role"] for m in retry["messages"]] == ["user", "assistant", "user"]
+
+    def test_reuses_cached_summary_for_same_content(self, mock_anthropic_cls, mock_response):
+        """A re-run on identical content skips Claude; new content doesn't."""
+        mock_client = mock_anthropic_cls.return_value
+        mock_client.messages.create.return_value = mock_response(VALID_SUMMARIZE_RESPONSE)
+
+        first = summarize(SAMPLE_CONTENT)
+        second = summarize(SAMPLE_CONTENT)
+        summarize({**SAMPLE_CONTENT, "errors": [{"source": "x", "error": "timeout"}]})
+
+        assert second == first
+        assert mock_client.messages.create.call_count == 2
+
+    def test_cache_ignores_per_run_timestamps(self, mock_anthropic_cls, mock_response):
+        """A re-ingest that only re-stamps Published dates still hits the cache."""
+        mock_client = mock_anthropic_cls.return_value
+        mock_client.messages.create.return_value = mock_response(VALID_SUMMARIZE_RESPONSE)
+        restamped = {
+            **SAMPLE_CONTENT,
+            "anthropic": [{**SAMPLE_CONTENT["anthropic"][0], "published": "2025-03-04T09:30:00+00:00"}],
+        }
+
+        summarize(SAMPLE_CONTENT)
+        summarize(restamped)
+
+        mock_client.messages.create.assert_called_once()
+
+    def test_cache_bypass_and_expiry(self, mock_anthropic_cls, mock_response):
+        """SUMMARIZE_CACHE=0 skips the cache; entries older than the TTL are ignored."""
+        mock_client = mock_anthropic_cls.return_value
+        mock_client.messages.create.return_value = mock_response(VALID_SUMMARIZE_RESPONSE)
+
+        with patch("src.summarize.SUMMARIZE_CACHE_ENABLED", False):
+            summarize(SAMPLE_CONTENT)
+            summarize(SAMPLE_CONTENT)
+        assert mock_client.messages.create.call_count == 2
+
+        summarize(SAMPLE_CONTENT)
+        with patch("src.summarize.SUMMARIZE_CACHE_TTL_S", -1):
+            summarize(SAMPLE_CONTENT)
+        assert mock_client.messages.create.call_count == 4
+
+    def test_retries_on_api_error(self, mock_anthropic_cls, no_sleep, mock_response, api_error):
         """429/500/503 triggers retry with backoff."""
         mock_client = MagicMock()
         mock_anthropic_cls.return_value = mock_client
 
         # First two calls raise 429, third succeeds
-        error_429 = anthropic.APIStatusError(
-            message="rate limited",
-            response=MagicMock(status_code=429),
-            body={"error": {"message": "rate limited"}},
-        )
         mock_client.messages.create.side_effect = [
-            error_429,
-            error_429,
-            _mock_response(VALID_SUMMARIZE_RESPONSE),
+            api_error(429),
+            api_error(429),
+            mock_response(VALID_SUMMARIZE_RESPONSE),
         ]
 
         result = summarize(SAMPLE_CONTENT)
 
         assert "themes" in result
-        assert mock_sleep.call_count == 2  # slept before retry 2 and 3
+        assert no_sleep.call_count == 2  # slept before retry 2 and 3
 
-    @patch("src.summarize.anthropic.Anthropic")
-    def test_raises_after_all_retries_exhausted(self, mock_anthropic_cls):
+    def test_raises_after_all_retries_exhausted(self, mock_anthropic_cls, api_error):
         """Hard fail if all API retries exhausted."""
         mock_client = MagicMock()
         mock_anthropic_cls.return_value = mock_client
 
-        error_500 = anthropic.APIStatusError(
-            message="internal error",
-            response=MagicMock(status_code=500),
-            body={"error": {"message": "internal error"}},
-        )
-        mock_client.messages.create.side_effect = error_500
+        mock_client.messages.create.side_effect = api_error(500)
 
         with pytest.raises(anthropic.APIStatusError):
             summarize(SAMPLE_CONTENT)
 
-    @patch("src.summarize.anthropic.Anthropic")
-    def test_raises_on_persistent_invalid_json(self, mock_anthropic_cls):
+    def test_raises_on_persistent_invalid_json(self, mock_anthropic_cls, mock_response):
         """If both attempts produce invalid JSON, raises ValueError."""
         mock_client = MagicMock()
         mock_anthropic_cls.return_value = mock_client
 
-        mock_client.messages.create.return_value = _mock_response("still not json")
+        mock_client.messages.create.return_value = mock_response("still not json")
 
         with pytest.raises(ValueError, match="Summarize failed"):
             summarize(SAMPLE_CONTENT)
 
-    @patch("src.summarize.anthropic.Anthropic")
-    def test_handles_markdown_fenced_json(self, mock_anthropic_cls):
+    def test_handles_markdown_fenced_json(self, mock_anthropic_cls, mock_response):
         """JSON wrapped in ```json fences is still parsed correctly."""
         mock_client = MagicMock()
         mock_anthropic_cls.return_value = mock_client
 
         fenced = f"```json\n{VALID_SUMMARIZE_RESPONSE}\n```"
-        mock_client.messages.create.return_value = _mock_response(fenced)
+        mock_client.messages.create.return_value = mock_response(fenced)
 
         result = summarize(SAMPLE_CONTENT)
 
-        assert "themes" in result
+        assert result == _VALID_SUMMARIZE_DICT
 
 
 # ── helpers ────────────────────────────────────────────
@@ -222,6 +330,17 @@ class TestHelpers:
         result = _try_parse_json('```json\n{"a": 1}\n```')
         assert result == {"a": 1}
 
+    @pytest.mark.parametrize("wrap", [
+        pytest.param("{}", id="raw"),
+        pytest.param("```json\n{}\n```", id="fenced"),
+        pytest.param("Here you go:\n```json\n{}\n```\nDone.", id="fenced-with-prose"),
+    ])
+    def test_try_parse_json_large_payload(self, wrap):
+        """A multi-KB reply parses whole, with or without fences."""
+        big = {"themes": [{"name": f"t{i}"} for i in range(500)]}
+
+        assert _try_parse_json(wrap.format(json.dumps(big))) == big
+
     def test_validate_requires_themes_list(self):
         assert _validate_summarize_output({"themes": [{"name": "x"}]}) is True
         assert _validate_summarize_output({"themes": []}) is False
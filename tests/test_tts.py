@@ -1,28 +1,25 @@
+import itertools
+import sys
+import threading
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
 
-from src.tts import text_to_chunks, synthesize_segment, synthesize_script
+from src.tts import _tts_client, text_to_chunks, synthesize_segment, synthesize_script
 from src.config import TTS_CHUNK_BYTE_LIMIT, INTERVIEWER_VOICE, EXPERT_VOICE
 
 
 # ── text_to_chunks ─────────────────────────────────────
 
+# Over-limit inputs, built once at import
+_SENTENCE_TEXT = "This is a sentence. " * 500  # ~10,000 chars
+_EMOJI_TEXT = "\U0001f600 " * 1500  # ~6000 bytes; each emoji is 4 bytes in UTF-8
+_CLAUSE_TEXT = ", ".join(f"clause number {i}" for i in range(100)) + "."
+_WORD_TEXT = "word " * 1500  # one giant 'sentence' with no clause delimiters
 
-class TestTextToChunks:
-    def test_respects_byte_limit(self):
-        """No chunk exceeds TTS_CHUNK_BYTE_LIMIT bytes (UTF-8)."""
-        # Create text that's well over the limit
-        text = "This is a sentence. " * 500  # ~10,000 chars
-
-        chunks = text_to_chunks(text)
-
-        for chunk in chunks:
-            assert len(chunk.encode("utf-8")) <= TTS_CHUNK_BYTE_LIMIT, (
-                f"Chunk exceeds byte limit: {len(chunk.encode('utf-8'))} bytes"
-            )
 
+class TestTextToChunks:
     def test_splits_on_sentences(self):
         """Prefers sentence boundaries over mid-word splits."""
         text = "First sentence. Second sentence. Third sentence."
@@ -43,35 +40,56 @@ class TestTextToChunks:
         assert len(chunks) == 1
         assert chunks[0] == text
 
-    def test_handles_utf8_multibyte(self):
-        """Byte limit accounts for multi-byte UTF-8 characters."""
-        # Each emoji is 4 bytes in UTF-8
-        text = "\U0001f600 " * 1500  # ~6000 bytes of emojis
-
-        chunks = text_to_chunks(text)
-
-        for chunk in chunks:
-            assert len(chunk.encode("utf-8")) <= TTS_CHUNK_BYTE_LIMIT
-
-    def test_splits_long_sentence_on_clauses(self):
-        """A single sentence exceeding the limit splits on clause boundaries."""
-        clauses = ["clause number " + str(i) for i in range(100)]
-        text = ", ".join(clauses) + "."
-
-        chunks = text_to_chunks(text, byte_limit=200)
-
-        for chunk in chunks:
-            assert len(chunk.encode("utf-8")) <= 200
-
-    def test_splits_on_words_as_last_resort(self):
-        """If clauses are still too long, falls back to word splitting."""
-        # One giant 'sentence' with no clause delimiters
-        text = "word " * 1500
-
-        chunks = text_to_chunks(text, byte_limit=100)
-
-        for chunk in chunks:
-            assert len(chunk.encode("utf-8")) <= 100
+    @pytest.mark.parametrize("text,limit", [
+        pytest.param(_SENTENCE_TEXT, TTS_CHUNK_BYTE_LIMIT, id="sentences"),
+        pytest.param(_EMOJI_TEXT, TTS_CHUNK_BYTE_LIMIT, id="utf8-multibyte"),
+        pytest.param(_CLAUSE_TEXT, 200, id="clauses"),
+        pytest.param(_WORD_TEXT, 100, id="words"),
+    ])
+    def test_respects_byte_limit(self, text, limit):
+        """No chunk exceeds the byte limit (UTF-8), whichever boundary the
+        splitter falls back to: sentences, clauses, or words."""
+        for chunk in text_to_chunks(text, byte_limit=limit):
+            size = len(chunk.encode("utf-8"))
+            assert size <= limit, f"Chunk exceeds byte limit: {size} bytes"
+
+    def test_word_split_keeps_every_word_and_packs_chunks(self):
+        """Word splitting loses nothing and fills chunks up to the byte limit."""
+        text = " ".join(["héllo"] * 39)  # 6 bytes per word
+
+        chunks = text_to_chunks(text, byte_limit=20)
+
+        assert " ".join(chunks) == text
+        assert chunks == ["héllo héllo héllo"] * 13
+
+    def test_word_split_scales_linearly(self):
+        """The characters UTF-8 encoded grow linearly with the input — no
+        re-encoding of the growing chunk on every word. Counted with a
+        profile hook rather than timed, so a busy CI box can't fail it."""
+        def encoded_chars(text):
+            total = 0
+
+            def count_encodes(frame, event, arg):
+                nonlocal total
+                if event == "c_call" and isinstance(getattr(arg, "__self__", None), str) \
+                        and arg.__name__ == "encode":
+                    total += len(arg.__self__)
+
+            sys.setprofile(count_encodes)
+            try:
+                text_to_chunks(text, byte_limit=100)
+            finally:
+                sys.setprofile(None)
+            return total
+
+        text = _WORD_TEXT * 10
+
+        n, n2 = encoded_chars(text), encoded_chars(text * 2)
+
+        assert n2 <= 2 * n, f"{n} -> {n2} characters encoded"
+        # Each split level (whole text, sentence, clause, word) encodes the
+        # input about once; re-encoding the chunk per word costs ~14x here
+        assert n <= 4 * len(text), f"{n} characters encoded for {len(text)}"
 
 
 # ── synthesize_segment ─────────────────────────────────
@@ -93,9 +111,8 @@ class TestSynthesizeSegment:
         assert len(result) > 0
         mock_client.synthesize_speech.assert_called_once()
 
-    @patch("src.tts.time.sleep")
     @patch("src.tts.texttospeech.TextToSpeechClient")
-    def test_retries_on_failure(self, mock_client_cls, mock_sleep):
+    def test_retries_on_failure(self, mock_client_cls, no_sleep):
         """Retries on API errors with backoff."""
         mock_client = MagicMock()
         mock_client_cls.return_value = mock_client
@@ -111,11 +128,61 @@ class TestSynthesizeSegment:
         result = synthesize_segment("Hello", EXPERT_VOICE)
 
         assert result == b"\xff\xfb\x90\x00"
-        assert mock_sleep.call_count == 1
+        assert no_sleep.call_count == 1
+
+    @patch("src.tts.texttospeech.TextToSpeechClient")
+    def test_reuses_voice_params_per_voice(self, mock_client_cls):
+        """Request params are built once per voice, not per chunk."""
+        synth = mock_client_cls.return_value.synthesize_speech
+        synth.return_value = MagicMock(audio_content=b"x")
+
+        synthesize_segment("Hello", INTERVIEWER_VOICE)
+        synthesize_segment("World", INTERVIEWER_VOICE)
+        synthesize_segment("Hi", EXPERT_VOICE)
+
+        voices = [c.kwargs["voice"] for c in synth.call_args_list]
+        assert voices[0] is voices[1]
+        assert voices[2] is not voices[0]
+        assert voices[2].name == EXPERT_VOICE["name"]
+
+    @patch("src.tts.texttospeech.TextToSpeechClient")
+    def test_reuses_client_across_chunks(self, mock_client_cls):
+        """The TTS client is built once, not per chunk."""
+        mock_client_cls.return_value.synthesize_speech.return_value = MagicMock(audio_content=b"x")
+
+        synthesize_segment("Hello", INTERVIEWER_VOICE)
+        synthesize_segment("World", EXPERT_VOICE)
+
+        mock_client_cls.assert_called_once()
+
+    @patch("src.tts.texttospeech.TextToSpeechClient")
+    def test_builds_one_client_under_concurrent_first_use(self, mock_client_cls):
+        """Pool workers racing on the first call still share one client."""
+        # A slow constructor widens the race (time.sleep is stubbed by no_sleep)
+        mock_client_cls.side_effect = lambda: threading.Event().wait(0.01) or MagicMock()
+        barrier = threading.Barrier(8, timeout=5)
+
+        def first_use():
+            barrier.wait()
+            return _tts_client()
+
+        threads = [threading.Thread(target=first_use) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        mock_client_cls.assert_called_once()
 
 
 # ── synthesize_script ──────────────────────────────────
 
+# Ten single-chunk turns alternating speakers, built once at import
+_ALTERNATING_SEGMENTS = [
+    {"speaker": "interviewer" if i % 2 == 0 else "expert", "text": f"Segment {i}."}
+    for i in range(10)
+]
+
 
 class TestSynthesizeScript:
     @patch("src.tts.synthesize_segment")
@@ -141,16 +208,10 @@ class TestSynthesizeScript:
     @patch("src.tts.synthesize_segment")
     def test_substitutes_silence_on_failure(self, mock_synth):
         """Single chunk failure produces silence (empty bytes), not crash."""
-        call_count = 0
-
-        def side_effect(text, voice):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 2:
-                raise Exception("TTS failed")
-            return b"\xff\xfb\x90\x00" * 10
-
-        mock_synth.side_effect = side_effect
+        ok = b"\xff\xfb\x90\x00" * 10
+        mock_synth.side_effect = itertools.chain(
+            [ok, Exception("TTS failed")], itertools.repeat(ok)
+        )
 
         segments = [
             {"speaker": "interviewer", "text": "First segment."},
@@ -168,25 +229,14 @@ class TestSynthesizeScript:
     @patch("src.tts.synthesize_segment")
     def test_aborts_on_mass_failure(self, mock_synth):
         """>30% chunk failure raises RuntimeError."""
-        call_count = 0
-
-        def side_effect(text, voice):
-            nonlocal call_count
-            call_count += 1
-            if call_count <= 2:
-                return b"\xff\xfb\x90\x00"
-            raise Exception("TTS failed")
-
-        mock_synth.side_effect = side_effect
+        ok = b"\xff\xfb\x90\x00"
+        mock_synth.side_effect = itertools.chain(
+            [ok, ok], itertools.repeat(Exception("TTS failed"), 8)
+        )
 
         # 10 segments: first 2 succeed, next 8 fail -> 80% failure
-        segments = [
-            {"speaker": "interviewer" if i % 2 == 0 else "expert", "text": f"Segment {i}."}
-            for i in range(10)
-        ]
-
         with pytest.raises(RuntimeError, match="TTS abort"):
-            synthesize_script(segments)
+            synthesize_script(_ALTERNATING_SEGMENTS)
 
     @patch("src.tts.synthesize_segment")
     def test_selects_correct_voice(self, mock_synth):
@@ -202,8 +252,119 @@ class TestSynthesizeScript:
 
         synthesize_script(segments)
 
-        calls = mock_synth.call_args_list
-        assert calls[0][0][1] == INTERVIEWER_VOICE
-        assert calls[1][0][1] == EXPERT_VOICE
-        assert calls[2][0][1] == INTERVIEWER_VOICE
-        assert calls[3][0][1] == EXPERT_VOICE
+        # Segments run concurrently — match calls by text, not call order
+        voices = {c[0][0]: c[0][1] for c in mock_synth.call_args_list}
+        assert voices["Hello."] == INTERVIEWER_VOICE
+        assert voices["Hi."] == EXPERT_VOICE
+        assert voices["Topic one."] == INTERVIEWER_VOICE
+        assert voices["Good point."] == EXPERT_VOICE
+
+    @patch("src.tts.synthesize_segment")
+    def test_synthesizes_segments_concurrently(self, mock_synth):
+        """Segments are in flight at once; paths keep script order."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def side_effect(text, voice):
+            barrier.wait()  # BrokenBarrierError if synthesized serially
+            return text.encode()
+
+        mock_synth.side_effect = side_effect
+
+        segments = [
+            {"speaker": "interviewer", "text": f"Segment {i}."}
+            for i in range(3)
+        ]
+
+        paths = synthesize_script(segments)
+
+        assert [p.read_bytes() for p in paths] == [b"Segment 0.", b"Segment 1.", b"Segment 2."]
+
+    @patch("src.tts.concat_mp3")
+    @patch("src.tts.text_to_chunks", return_value=["a ", "b ", "c"])
+    @patch("src.tts.synthesize_segment")
+    def test_synthesizes_chunks_of_one_segment_concurrently(
+        self, mock_synth, mock_chunks, mock_concat,
+    ):
+        """A single long segment's chunks are in flight at once, joined in order."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def side_effect(text, voice):
+            barrier.wait()
+            return text.encode()
+
+        mock_synth.side_effect = side_effect
+        joined = []
+        mock_concat.side_effect = lambda paths, output, work_dir: joined.extend(
+            p.read_bytes() for p in paths
+        )
+
+        paths = synthesize_script([{"speaker": "expert", "text": "a b c"}])
+
+        assert joined == [b"a ", b"b ", b"c"]
+        assert mock_concat.call_args.args[1] == paths[0]
+
+    @patch("src.tts.synthesize_segment")
+    def test_synthesizes_repeated_chunks_once(self, mock_synth):
+        """Identical text with the same voice hits TTS once; another voice doesn't share it."""
+        mock_synth.side_effect = lambda text, voice: f"{voice['name']}:{text}".encode()
+        segments = [
+            {"speaker": "interviewer", "text": "Welcome back."},
+            {"speaker": "expert", "text": "Welcome back."},
+            {"speaker": "interviewer", "text": "Welcome back."},
+        ]
+
+        paths = synthesize_script(segments)
+
+        assert mock_synth.call_count == 2
+        assert paths[2].read_bytes() == paths[0].read_bytes()
+        assert paths[1].read_bytes() != paths[0].read_bytes()
+
+    @patch("src.tts.synthesize_segment")
+    def test_reuses_cached_script(self, mock_synth, tmp_path):
+        """An identical script is served from cache_dir without calling TTS."""
+        mock_synth.return_value = b"\xff\xfb\x90\x00"
+        segments = [
+            {"speaker": "interviewer", "text": "Hello."},
+            {"speaker": "expert", "text": "Hi."},
+        ]
+
+        first = synthesize_script(segments, cache_dir=tmp_path)
+        second = synthesize_script(segments, cache_dir=tmp_path)
+
+        assert mock_synth.call_count == 2
+        assert [p.name for p in second] == [p.name for p in first]
+        assert all(p.read_bytes() == b"\xff\xfb\x90\x00" for p in second)
+
+        synthesize_script([{"speaker": "expert", "text": "Different."}], cache_dir=tmp_path)
+        assert mock_synth.call_count == 3
+
+    @patch("src.tts.synthesize_segment")
+    def test_does_not_cache_failed_chunks(self, mock_synth, tmp_path):
+        """A run that substituted silence retries just the failed chunk next time."""
+        mock_synth.side_effect = [Exception("TTS failed")] + [b"\xff\xfb"] * 4
+        segments = [
+            {"speaker": "interviewer", "text": f"Segment {i}."}
+            for i in range(4)
+        ]
+
+        synthesize_script(segments, cache_dir=tmp_path)
+        paths = synthesize_script(segments, cache_dir=tmp_path)
+
+        assert mock_synth.call_count == 5
+        assert all(p.read_bytes() == b"\xff\xfb" for p in paths)
+
+    @patch("src.tts.synthesize_segment")
+    def test_reuses_cached_chunks_across_scripts(self, mock_synth, tmp_path):
+        """A chunk seen in an earlier script is read from disk, per voice."""
+        mock_synth.return_value = b"\xff\xfb\x90\x00"
+        intro = {"speaker": "interviewer", "text": "Welcome to the show."}
+
+        synthesize_script([intro, {"speaker": "expert", "text": "Week one."}], cache_dir=tmp_path)
+        paths = synthesize_script(
+            [intro, {"speaker": "expert", "text": "Welcome to the show."}],
+            cache_dir=tmp_path,
+        )
+
+        # Same text in the other voice is synthesized; the intro is not
+        assert mock_synth.call_count == 3
+        assert paths[0].read_bytes() == b"\xff\xfb\x90\x00"